@@ -15,7 +15,7 @@ class Metric(Enum):
     @classmethod
     def from_type_name(cls, type_name: str) -> Optional['Metric']:
         """Convert a type name back to a Metric enum"""
-        for metric in cls:
-            if metric.type_name == type_name:
-                return metric
-        return None
+        return _METRICS_BY_TYPE_NAME.get(type_name)
+
+_METRICS_BY_TYPE_NAME = {metric.type_name: metric for metric in Metric}
+
@@ -1,10 +1,13 @@
 from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtCore
 import multiprocessing
 from itertools import cycle
+from collections import OrderedDict
 from loguru import logger
 from queue import Empty
 from pathlib import Path
@@ -22,7 +25,7 @@ def configure_plotter_logger():
     logger.add(sys.stderr, level="DEBUG")
 
     log_path = Path.cwd() / "pftpyclient" / "logs" / "perf_plotter_debug.log"
-    logger.add(log_path, rotation="10 MB", retention="1 week", level="DEBUG")
+    logger.add(log_path, rotation="10 MB", retention="1 week", level="DEBUG", enqueue=True)
     return logger
 
 class TimeAxisItem(pg.AxisItem):
@@ -46,6 +49,9 @@ class WalletPerformancePlotter:
         'session_id'
     ]
 
+    MAX_PLOTTED_PROCESSES = 32  # Most recently updated processes kept in each live plot
+    MAX_IN_MEMORY_ROWS = 10_000  # Most recent performance log rows kept in perf_df
+
     def __init__(self, queue: multiprocessing.Queue, shutdown_event: multiprocessing.Event):
         self.logger = configure_plotter_logger()
         self.logger.debug("Initializing WalletPerformancePlotter")
@@ -71,15 +77,17 @@ class WalletPerformancePlotter:
         self.count_bars = pg.BarGraphItem(x=[], height=[], width=0.5)
         self.count_plot.addItem(self.count_bars)
 
-        self.duration_data = {}
-        self.count_data = {}
+        self.duration_data = OrderedDict()
+        self.count_data = OrderedDict()
 
         # Setup colors
         self.colors = cycle(['c', 'r', 'b', 'g', 'w', 'y', 'm'])
         self.bar_colors = {}
+        self._plot_titles = {metric: f"{metric.type_name} ({metric.unit})" for metric in Metric}
 
         self.timer = None
         self.closed = False
+        self._error_count = 0
 
         self.logger = logger
 
@@ -89,6 +97,15 @@ class WalletPerformancePlotter:
         self.perf_log_path = metrics_dir / "performance_metrics.csv"
         self.perf_df = self._init_perf_log()
 
+        # Columns that are constant for the lifetime of the plotter process
+        self._platform = platform.system()
+        self._python_version = platform.python_version()
+        self._session_id = id(self)
+
+        # Rows collected since the last save, written to disk off the Qt event loop
+        self._pending_rows = []
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+
         self.last_save_time = datetime.now()
         self.save_interval = 300  # seconds
 
@@ -97,22 +114,46 @@ class WalletPerformancePlotter:
 
         if self.perf_log_path.exists():
             try:
-                return pd.read_csv(self.perf_log_path)
+                return pd.read_csv(self.perf_log_path).iloc[-self.MAX_IN_MEMORY_ROWS:].reset_index(drop=True)
             except Exception as e:
                 self.logger.error(f"Error reading performance log: {e}")
 
         return pd.DataFrame(columns=self.PERF_LOG_COLUMNS)
     
     def _save_metrics(self, force: bool = False):
-        """Save metrics to CSV if interval has elapsed or force is True"""
+        """Save pending metrics to CSV if interval has elapsed or force is True"""
         now = datetime.now()
         if force or (now - self.last_save_time).total_seconds() >= self.save_interval:
-            try:
-                self.perf_df.to_csv(self.perf_log_path, index=False)
-                self.last_save_time = now
-                self.logger.debug(f"Saved performance log to {self.perf_log_path}")
-            except Exception as e:
-                self.logger.error(f"Error saving performance log: {e}")
+            self.last_save_time = now
+            if not self._pending_rows:
+                return
+
+            batch, self._pending_rows = self._pending_rows, []
+            batch_df = pd.DataFrame(batch, columns=self.PERF_LOG_COLUMNS)
+            # Rows carry epoch floats; convert the whole column to local datetimes at once
+            batch_df['timestamp'] = (
+                pd.to_datetime(batch_df['timestamp'], unit='s', utc=True)
+                .dt.tz_convert(now.astimezone().tzinfo)
+                .dt.tz_localize(None)
+            )
+            self.perf_df = pd.concat([self.perf_df, batch_df], ignore_index=True)
+            # Saved rows are already on disk, so only a recent window is kept in memory
+            if len(self.perf_df) > self.MAX_IN_MEMORY_ROWS:
+                self.perf_df = self.perf_df.iloc[-self.MAX_IN_MEMORY_ROWS:].reset_index(drop=True)
+            self._io_executor.submit(self._write_metrics, batch_df)
+
+    def _write_metrics(self, batch_df: pd.DataFrame):
+        """Append a batch of metrics to the CSV log. Runs on the I/O worker thread"""
+        try:
+            batch_df.to_csv(
+                self.perf_log_path,
+                mode='a',
+                header=not self.perf_log_path.exists(),
+                index=False
+            )
+            self.logger.debug(f"Saved {len(batch_df)} rows to performance log at {self.perf_log_path}")
+        except Exception as e:
+            self.logger.error(f"Error saving performance log: {e}")
 
     def start(self):
         """Start the plotter and Qt event loop"""
@@ -127,6 +168,7 @@ class WalletPerformancePlotter:
 
     def _process_queue(self):
         """Process the performance data queue"""
+        changed_duration = changed_count = False
         try:
             while not self.queue.empty():
                 try:
@@ -139,61 +181,82 @@ class WalletPerformancePlotter:
                         if process_name and metrics:
                             metric_type = Metric.from_type_name(metrics.get('type'))
                             metric_value = float(metrics.get('value', 0))
+                            now = time.time()
 
-                            new_row = pd.DataFrame([{
-                                'timestamp': datetime.now(),
+                            self._pending_rows.append({
+                                'timestamp': now,
                                 'process': process_name,
                                 'metric_type': metric_type.type_name, 
                                 'metric_value': metric_value,
                                 'metric_unit': metric_type.unit,
-                                'platform': platform.system(),
-                                'python_version': platform.python_version(),
-                                'session_id': id(self)
-                            }], columns=self.PERF_LOG_COLUMNS)
-                            self.perf_df = pd.concat([self.perf_df, new_row], ignore_index=True)
+                                'platform': self._platform,
+                                'python_version': self._python_version,
+                                'session_id': self._session_id
+                            })
                         
                             # Update live plot data
                             match metric_type:
                                 case Metric.DURATION:
                                     self.duration_data[process_name] = {
                                         'duration': metric_value,
-                                        'timestamp': datetime.now()
+                                        'timestamp': now
                                     }
+                                    self._mark_recent(self.duration_data, process_name)
+                                    changed_duration = True
                                 case Metric.COUNT:
                                     if process_name not in self.count_data:
                                         self.count_data[process_name] = {
                                             'count': 0,
-                                            'timestamp': datetime.now()
+                                            'timestamp': now
                                         }
                                     self.count_data[process_name]['count'] += 1
-                                    self.count_data[process_name]['timestamp'] = datetime.now()
+                                    self.count_data[process_name]['timestamp'] = now
+                                    self._mark_recent(self.count_data, process_name)
+                                    changed_count = True
 
                 except Empty:
                     break
 
-            self._update_plots()
+            # Elapsed-time labels advance every tick even when no new data arrived
+            self._update_plots(changed_duration, changed_count)
             self._save_metrics()
 
         except Exception as e:
-            self.logger.error(f"Error processing queue: {e}", exc_info=True)
-
-    def _update_plots(self):
-        """Update all plots"""
+            self._log_tick_error(f"Error processing queue: {e}")
+
+    def _log_tick_error(self, message: str):
+        """Log an error raised during a timer tick, with a traceback only every 60th occurrence"""
+        if self._error_count % 60 == 0:
+            self.logger.opt(exception=True).error(message)
+        else:
+            self.logger.error(message)
+        self._error_count += 1
+
+    def _mark_recent(self, data_dict: OrderedDict, process_name: str):
+        """Move a process to the most-recent end and evict the oldest beyond MAX_PLOTTED_PROCESSES"""
+        data_dict.move_to_end(process_name)
+        while len(data_dict) > self.MAX_PLOTTED_PROCESSES:
+            evicted, _ = data_dict.popitem(last=False)
+            if evicted not in self.duration_data and evicted not in self.count_data:
+                self.bar_colors.pop(evicted, None)
+
+    def _update_plots(self, changed_duration: bool = True, changed_count: bool = True):
+        """Update all plots, rebuilding bars only for those whose data changed this tick"""
         try:
             if self.duration_data:
-                self._update_metric_plot(Metric.DURATION)
+                self._update_metric_plot(Metric.DURATION, changed_duration)
 
             if self.count_data:
-                self._update_metric_plot(Metric.COUNT)
+                self._update_metric_plot(Metric.COUNT, changed_count)
 
         except Exception as e:
-            self.logger.error(f"Error updating plots: {e}", exc_info=True)
+            self._log_tick_error(f"Error updating plots: {e}")
 
-    def _update_metric_plot(self, metric_type: Metric):
-        """Update a metric's bar chart"""
+    def _update_metric_plot(self, metric_type: Metric, rebuild_bars: bool = True):
+        """Update a metric's bar chart labels, and its bars when rebuild_bars is set"""
         try:
             value_key = f'{metric_type.type_name}'
-            title = f"{metric_type.type_name} ({metric_type.unit})"
+            title = self._plot_titles[metric_type]
 
             match metric_type:
                 case Metric.DURATION:
@@ -217,20 +280,29 @@ class WalletPerformancePlotter:
                 reverse=True
             )
 
-            base_names = []
-            display_names = []
-            values = []
+            n = len(sorted_ops)
+            base_names, values, timestamps = zip(*sorted_ops)
+            values = np.asarray(values, dtype=np.float64)
+            timestamps = np.asarray(timestamps, dtype=np.float64)
+
+            # Create labels with elapsed time, computed for all bars at once
+            elapsed = (time.time() - timestamps).astype(np.int64)
 
-            # Create labels with elapsed time
-            for op_name, duration, timestamp in sorted_ops:
-                elapsed = datetime.now() - timestamp
-                if elapsed.total_seconds() < 60:
-                    time_str = f"{elapsed.total_seconds():.0f}s ago"
+            display_names = []
+            for op_name, total in zip(base_names, elapsed.tolist()):
+                if total < 60:
+                    time_str = f"{total}s ago"
                 else:
-                    time_str = f"{elapsed.total_seconds() // 60:.0f}m {elapsed.total_seconds() - (elapsed.total_seconds() // 60) * 60:.0f}s ago"
-                base_names.append(op_name)
+                    minutes, seconds = divmod(total, 60)
+                    time_str = f"{minutes}m {seconds}s ago"
                 display_names.append(f"{op_name} ({time_str})")
-                values.append(duration)
+
+            # Update axis labels
+            left_axis = plot.getAxis('left')
+            left_axis.setTicks([list(enumerate(display_names))])
+
+            if not rebuild_bars:
+                return
 
             # Assign colors to new processes
             for process, _, _ in sorted_ops:
@@ -238,14 +310,14 @@ class WalletPerformancePlotter:
                     self.bar_colors[process] = next(self.colors)
 
             # Create y positions for horizontal bars
-            y_pos = np.arange(len(display_names))
+            y_pos = np.arange(n)
 
             # Remove old bars and create new horizontal ones
             plot.removeItem(bars)
             bars = pg.BarGraphItem(
                 x0=0,                # Starts bars at 0
                 y=y_pos,            # Y position for each bar
-                width=np.array(values, dtype=float),    # Bar length
+                width=values,       # Bar length
                 height=0.5,         # Bar thickness
                 brushes=[self.bar_colors[name] for name in base_names]  # Color for each bar
             )
@@ -253,19 +325,15 @@ class WalletPerformancePlotter:
 
             # Update plot properties
             plot.setTitle(title)
-
-            # Update axis labels
-            left_axis = plot.getAxis('left')
-            left_axis.setTicks([list(enumerate(display_names))])
             left_axis.setLabel('Processes')
 
             bottom_axis = plot.getAxis('bottom')
             bottom_axis.setLabel(metric_type.type_name)
             
             # Force x-axis to start at 0 and give 10% margin on the right
-            plot.setXRange(0, max(values) * 1.1)
+            plot.setXRange(0, values.max() * 1.1)
             # Adjust y-axis to fit all bars
-            plot.setYRange(-0.5, len(display_names) - 0.5)
+            plot.setYRange(-0.5, n - 0.5)
 
             # Store bars reference
             match metric_type:
@@ -275,78 +343,12 @@ class WalletPerformancePlotter:
                     self.count_bars = bars
 
         except Exception as e:
-            self.logger.error(f"Error updating {metric_type.type_name} plot: {e}", exc_info=True)
-    
-    # def _update_duration_plot(self):
-    #     """Update the duration bar chart"""
-    #     try:
-    #         # Sort processes by duration for better visualization
-    #         sorted_ops = sorted(
-    #             [(name, data['duration'], data['timestamp']) 
-    #              for name, data in self.duration_data.items()],
-    #             key=lambda x: x[1],
-    #             reverse=True
-    #         )
-
-    #         base_names = []
-    #         display_names = []
-    #         durations = []
-
-    #         # Create labels with elapsed time
-    #         for op_name, duration, timestamp in sorted_ops:
-    #             elapsed = datetime.now() - timestamp
-    #             if elapsed.total_seconds() < 60:
-    #                 time_str = f"{elapsed.total_seconds():.0f}s ago"
-    #             else:
-    #                 time_str = f"{elapsed.total_seconds() // 60:.0f}m {elapsed.total_seconds() - (elapsed.total_seconds() // 60) * 60:.0f}s ago"
-    #             base_names.append(op_name)
-    #             display_names.append(f"{op_name} ({time_str})")
-    #             durations.append(duration)
-
-    #         # Assign colors to new processes
-    #         for process, _, _ in sorted_ops:
-    #             if process not in self.bar_colors:
-    #                 self.bar_colors[process] = next(self.colors)
-            
-    #         # Create y positions for horizontal bars
-    #         y_pos = np.arange(len(display_names))
-
-    #         # Remove old bars and create new horizontal ones
-    #         self.duration_plot.removeItem(self.duration_bars)
-    #         self.duration_bars = pg.BarGraphItem(
-    #             x0=0,                # Starts bars at 0
-    #             y=y_pos,            # Y position for each bar
-    #             width=np.array(durations, dtype=float),    # Bar length
-    #             height=0.5,         # Bar thickness
-    #             brushes=[self.bar_colors[name] for name in base_names]  # Color for each bar
-    #         )
-    #         self.duration_plot.addItem(self.duration_bars)
-
-    #         # Update axis with labels
-    #         left_axis = self.duration_plot.getAxis('left')
-    #         left_axis.setTicks([list(enumerate(display_names))])
-    #         left_axis.setLabel('Processes')
-
-    #         bottom_axis = self.duration_plot.getAxis('bottom')
-    #         bottom_axis.setLabel('Duration (ms)')
-
-    #         # Force x-axis to start at 0 and give 10% margin on the right
-    #         self.duration_plot.setXRange(0, max(durations) * 1.1)
-    #         # Adjust y-axis to fit all bars
-    #         self.duration_plot.setYRange(-0.5, len(display_names) - 0.5)
-
-    #     except Exception as e:
-    #         self.logger.error(f"Error updating plot: {e}", exc_info=True)
-
-    @staticmethod
-    def _append(arr, value):
-        """Append value to numpy array, shifting existing values left"""
-        arr[:-1] = arr[1:]
-        arr[-1] = value
+            self._log_tick_error(f"Error updating {metric_type.type_name} plot: {e}")
 
     def handle_close(self, event):
         """Handle the close event of the plotter window"""
         self._save_metrics(force=True)
+        self._io_executor.shutdown(wait=True)
 
         # Stop the timer
         if hasattr(self, 'timer'):
@@ -14,6 +14,18 @@ from xrpl.core.keypairs.ed25519 import ED25519
 backend = default_backend()
 iterations = 100_000
 
+def _resolve_ripemd160():
+    """Return a one-shot RIPEMD160 digest function, preferring OpenSSL via hashlib.
+    OpenSSL 3 builds may disable ripemd160, in which case pycryptodome (an xrpl-py dependency) is used."""
+    try:
+        new_hash('ripemd160')
+        return lambda data: new_hash('ripemd160', data).digest()
+    except ValueError:
+        from Crypto.Hash import RIPEMD160
+        return lambda data: RIPEMD160.new(data).digest()
+
+_ripemd160 = _resolve_ripemd160()
+
 def _derive_key(password: bytes, salt: bytes, iterations: int = iterations) -> bytes:
     """Derive a secret key from a given password and salt"""
     kdf = PBKDF2HMAC(
@@ -24,38 +36,41 @@ def _derive_key(password: bytes, salt: bytes, iterations: int = iterations) -> b
 def password_encrypt(message: bytes, password: str, iterations: int = iterations) -> bytes:
     salt = secrets.token_bytes(16)
     key = _derive_key(password.encode(), salt, iterations)
-    return b64e(
-        b'%b%b%b' % (
-            salt,
-            iterations.to_bytes(4, 'big'),
-            b64d(Fernet(key).encrypt(message)),
-        )
-    )
+    # Single outer base64 layer over salt || iterations || raw Fernet token
+    return b64e(salt + iterations.to_bytes(4, 'big') + b64d(Fernet(key).encrypt(message)))
 
 def password_decrypt(token: bytes, password: str) -> bytes:
     ''' use:
     decrypted_message = password_decrypt(encrypted_message, password)
     '''
-    decoded = b64d(token)
-    salt, iter, token = decoded[:16], decoded[16:20], b64e(decoded[20:])
+    decoded = memoryview(b64d(token))
+    # Fernet only accepts its base64 token form, so re-encode the payload without copying the slice first
+    salt, iter, token = decoded[:16].tobytes(), decoded[16:20], b64e(decoded[20:])
     iterations = int.from_bytes(iter, 'big')
     key = _derive_key(password.encode(), salt, iterations)
     return Fernet(key).decrypt(token)
 
 def get_account_id(public_key_hex: str) -> bytes:
     """Convert a public key to an account ID (a 20-byte identifier)"""
-    # Convert hex to bytes
-    public_key_bytes = bytes.fromhex(public_key_hex)
+    # RIPEMD160 of the SHA256 of the public key bytes
+    return _ripemd160(sha256(bytes.fromhex(public_key_hex)).digest())
+
+def _strip_ed(key_hex: str) -> bytes:
+    """Convert a hex key to bytes, removing the ED prefix if present"""
+    key_bytes = bytes.fromhex(key_hex)
+    if len(key_bytes) == 33 and key_bytes[0] == 0xED:
+        return key_bytes[1:]
+    return key_bytes
 
-    # SHA256 of the public key
-    sha256_hash = sha256(public_key_bytes).digest()
+def _get_private_curve(seed_bytes: bytes) -> bytes:
+    """Derive the Curve25519 private key for a seed"""
+    # First derive the ED25519 keypair using XRPL's method
+    public_key_raw, private_key_raw = ED25519.derive_keypair(seed_bytes, is_validator=False)
 
-    # RIPEMD160 of the SHA256 hash
-    ripemd160_hash = new_hash('ripemd160')
-    ripemd160_hash.update(sha256_hash)
-    account_id = ripemd160_hash.digest()
+    # Combine private and public key for NaCl format (64 bytes)
+    private_key_combined = _strip_ed(private_key_raw) + _strip_ed(public_key_raw)
 
-    return account_id
+    return nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(private_key_combined)
 
 def derive_shared_secret(public_key_hex: str, seed_bytes: bytes) -> bytes:
     """
@@ -66,32 +81,8 @@ def derive_shared_secret(public_key_hex: str, seed_bytes: bytes) -> bytes:
     Returns:
         bytes: The shared secret
     """
-    # First derive the ED25519 keypair using XRPL's method
-    public_key_raw, private_key_raw = ED25519.derive_keypair(seed_bytes, is_validator=False)
-    
-    # Convert private key to bytes and remove ED prefix
-    private_key_bytes = bytes.fromhex(private_key_raw)
-    if len(private_key_bytes) == 33 and private_key_bytes[0] == 0xED:
-        private_key_bytes = private_key_bytes[1:]  # Remove the ED prefix
-    
-    # Convert public key to bytes and remove ED prefix
-    public_key_self_bytes = bytes.fromhex(public_key_raw)
-    if len(public_key_self_bytes) == 33 and public_key_self_bytes[0] == 0xED:
-        public_key_self_bytes = public_key_self_bytes[1:]  # Remove the ED prefix
-    
-    # Combine private and public key for NaCl format (64 bytes)
-    private_key_combined = private_key_bytes + public_key_self_bytes
-    
-    # Convert their public key
-    public_key_bytes = bytes.fromhex(public_key_hex)
-    if len(public_key_bytes) == 33 and public_key_bytes[0] == 0xED:
-        public_key_bytes = public_key_bytes[1:]  # Remove the ED prefix
-    
-    # Convert ED25519 keys to Curve25519
-    private_curve = nacl.bindings.crypto_sign_ed25519_sk_to_curve25519(private_key_combined)
-    public_curve = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(public_key_bytes)
-    
-    # Use raw X25519 function
-    shared_secret = nacl.bindings.crypto_scalarmult(private_curve, public_curve)
+    private_curve = _get_private_curve(seed_bytes)
+    public_curve = nacl.bindings.crypto_sign_ed25519_pk_to_curve25519(_strip_ed(public_key_hex))
 
-    return shared_secret
\ No newline at end of file
+    # Use raw X25519 function
+    return nacl.bindings.crypto_scalarmult(private_curve, public_curve)
@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+import pytest
+import xrpl
+import xrpl.asyncio
+from xrpl.models.response import Response, ResponseStatus
+from xrpl.models.transactions import Payment
+from xrpl.wallet import Wallet
+
+import pftpyclient.utilities.task_manager as task_manager
+from pftpyclient.utilities.task_manager import PostFiatTaskManager
+
+START_SEQUENCE = 100
+LAST_LEDGER_SEQUENCE = 50
+
+class FakeSignedPayment:
+    def __init__(self, sequence):
+        self.sequence = sequence
+        self.last_ledger_sequence = LAST_LEDGER_SEQUENCE
+
+    def get_hash(self):
+        return f"HASH{self.sequence}"
+
+class FakeLedger:
+    """Stands in for the network: records submissions and validates the sequences it accepted"""
+    def __init__(self, submit_results=None, never_validated=()):
+        self.submit_results = submit_results or {}
+        self.never_validated = set(never_validated)
+        self.submitted = []
+        self.validated_ledger = 10
+
+    async def submit(self, signed_payment, client):
+        self.submitted.append(signed_payment.sequence)
+        result = self.submit_results.get(signed_payment.sequence, 'tesSUCCESS')
+        return Response(status=ResponseStatus.SUCCESS, result={'engine_result': result, 'engine_result_message': 'rejected'})
+
+    async def latest_validated_ledger(self, client):
+        self.validated_ledger += 20
+        return self.validated_ledger
+
+    async def request(self, request):
+        sequence = int(request.transaction.removeprefix('HASH'))
+        if sequence in self.never_validated:
+            return Response(status=ResponseStatus.ERROR, result={'error': 'txnNotFound'})
+        return Response(
+            status=ResponseStatus.SUCCESS,
+            result={'hash': request.transaction, 'validated': True, 'meta': {'TransactionResult': 'tesSUCCESS'}}
+        )
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    def _make(ledger):
+        async def next_sequence(address, client):
+            return START_SEQUENCE
+
+        async def autofill_and_sign(payment, client, wallet):
+            return FakeSignedPayment(payment.sequence)
+
+        monkeypatch.setattr(task_manager, 'LEDGER_POLL_INTERVAL', 0)
+        monkeypatch.setattr(xrpl.asyncio.account, 'get_next_valid_seq_number', next_sequence)
+        monkeypatch.setattr(xrpl.asyncio.transaction, 'autofill_and_sign', autofill_and_sign)
+        monkeypatch.setattr(xrpl.asyncio.transaction, 'submit', ledger.submit)
+        monkeypatch.setattr(xrpl.asyncio.ledger, 'get_latest_validated_ledger_sequence', ledger.latest_validated_ledger)
+
+        manager = object.__new__(PostFiatTaskManager)
+        manager.user_wallet = Wallet.create()
+        manager.client = SimpleNamespace(request=ledger.request)
+        return manager
+    return _make
+
+def make_payments(count):
+    wallet = Wallet.create()
+    destination = Wallet.create().address
+    return [Payment(account=wallet.address, destination=destination, amount='1') for _ in range(count)]
+
+def test_chunks_submitted_in_sequence_order(make_manager):
+    ledger = FakeLedger()
+    manager = make_manager(ledger)
+
+    responses = manager._submit_chunk_payments(make_payments(4))
+
+    assert ledger.submitted == [100, 101, 102, 103]
+    assert [response.result['hash'] for response in responses] == ['HASH100', 'HASH101', 'HASH102', 'HASH103']
+
+def test_rejected_chunk_stops_later_chunks(make_manager):
+    ledger = FakeLedger(submit_results={101: 'tefPAST_SEQ'})
+    manager = make_manager(ledger)
+
+    responses = manager._submit_chunk_payments(make_payments(4))
+
+    assert ledger.submitted == [100, 101]
+    assert responses[0].result['hash'] == 'HASH100'
+    assert responses[1] == 'Transaction submission failed: tefPAST_SEQ: rejected'
+    assert responses[2] == 'Transaction submission failed: chunk 3 of 4 was not applied because chunk 2 failed'
+    assert responses[3] == 'Transaction submission failed: chunk 4 of 4 was not applied because chunk 2 failed'
+
+def test_expired_chunk_fails_later_chunks(make_manager):
+    ledger = FakeLedger(never_validated={101, 102})
+    manager = make_manager(ledger)
+
+    responses = manager._submit_chunk_payments(make_payments(3))
+
+    assert ledger.submitted == [100, 101, 102]
+    assert responses[0].result['hash'] == 'HASH100'
+    assert responses[1].startswith('Transaction submission failed: The latest validated ledger sequence')
+    assert responses[2] == 'Transaction submission failed: chunk 3 of 3 was not applied because chunk 2 failed'
+
+def test_sequence_lookup_failure_fails_every_chunk(make_manager, monkeypatch):
+    ledger = FakeLedger()
+    manager = make_manager(ledger)
+
+    async def next_sequence(address, client):
+        raise ConnectionError('node unreachable')
+
+    monkeypatch.setattr(xrpl.asyncio.account, 'get_next_valid_seq_number', next_sequence)
+
+    responses = manager._submit_chunk_payments(make_payments(3))
+
+    assert ledger.submitted == []
+    assert responses == ['Unexpected error: node unreachable'] * 3
@@ -0,0 +1,58 @@
+import math
+
+import pandas as pd
+
+from pftpyclient.utilities.task_manager import (
+    CSV_JSON_COLUMNS,
+    deserialize_csv_value,
+    serialize_csv_columns,
+)
+
+TX_JSON = {'Account': 'rExample', 'Memos': [{'Memo': {'MemoData': 'abcd'}}], 'Fee': '12', 'Flags': 0}
+META = {'TransactionResult': 'tesSUCCESS', 'delivered_amount': {'currency': 'PFT', 'value': '1.5'}, 'nested': None}
+
+def read_back(df, tmp_path):
+    path = tmp_path / 'cache.csv'
+    df.to_csv(path, index=False)
+    loaded = pd.read_csv(path)
+    for col in CSV_JSON_COLUMNS:
+        if col in loaded.columns:
+            loaded[col] = loaded[col].map(deserialize_csv_value)
+    return loaded
+
+def test_json_written_values_round_trip(tmp_path):
+    df = pd.DataFrame({'hash': ['A', 'B'], 'tx_json': [TX_JSON, {}], 'meta': [META, {'list': [1, 2.5, True]}]})
+
+    serialized = serialize_csv_columns(df)
+    assert serialized['tx_json'].iloc[0].startswith('{"Account"')
+    assert df['tx_json'].iloc[0] is TX_JSON
+
+    loaded = read_back(serialized, tmp_path)
+
+    assert loaded['tx_json'].tolist() == [TX_JSON, {}]
+    assert loaded['meta'].tolist() == [META, {'list': [1, 2.5, True]}]
+
+def test_legacy_repr_written_values_are_read(tmp_path):
+    # Older caches wrote dict columns with their Python repr
+    df = pd.DataFrame({'hash': ['A'], 'tx_json': [repr(TX_JSON)], 'meta': [str(META)]})
+
+    loaded = read_back(df, tmp_path)
+
+    assert loaded['tx_json'].iloc[0] == TX_JSON
+    assert loaded['meta'].iloc[0] == META
+
+def test_missing_and_empty_cells(tmp_path):
+    df = pd.DataFrame({'hash': ['A', 'B', 'C'], 'tx_json': [TX_JSON, None, float('nan')], 'meta': [META, '', None]})
+
+    loaded = read_back(serialize_csv_columns(df), tmp_path)
+
+    assert loaded['tx_json'].iloc[0] == TX_JSON
+    assert math.isnan(loaded['tx_json'].iloc[1])
+    assert math.isnan(loaded['tx_json'].iloc[2])
+    assert math.isnan(loaded['meta'].iloc[1])
+    assert math.isnan(loaded['meta'].iloc[2])
+
+def test_non_string_values_pass_through():
+    assert deserialize_csv_value(TX_JSON) is TX_JSON
+    assert math.isnan(deserialize_csv_value(float('nan')))
+    assert deserialize_csv_value(None) is None
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from pftpyclient.configuration.constants import TaskType
+from pftpyclient.utilities.task_manager import (
+    TASK_TYPE_DTYPE,
+    classify_task_string,
+    classify_task_strings,
+)
+
+def test_vectorized_matches_scalar_for_every_task_type():
+    strings = [f"{task_type.value}some task text" for task_type in TaskType]
+    strings += ["PROPOSED PF .. without the marker", "no pattern here", ""]
+
+    result = classify_task_strings(pd.Series(strings))
+
+    assert result.dtype == TASK_TYPE_DTYPE
+    assert result.tolist() == [classify_task_string(string) for string in strings]
+    assert result.tolist()[:len(TaskType)] == [task_type.name for task_type in TaskType]
+
+def test_overlapping_patterns_use_first_match():
+    strings = [
+        "REFUSAL REASON ___ see item .. below",
+        "REQUEST_POST_FIAT ___ step one .. step two",
+        "VERIFICATION PROMPT ___ then REWARD RESPONSE __ ",
+    ]
+
+    result = classify_task_strings(pd.Series(strings))
+
+    expected = [classify_task_string(string) for string in strings]
+    assert expected == ['PROPOSAL', 'PROPOSAL', 'VERIFICATION_PROMPT']
+    assert result.tolist() == expected
+
+def test_empty_and_missing_values_are_unknown():
+    assert classify_task_strings(pd.Series([], dtype=object)).tolist() == []
+
+    result = classify_task_strings(pd.Series(["", None, np.nan], index=[5, 6, 7]))
+
+    assert result.tolist() == ['UNKNOWN', 'UNKNOWN', 'UNKNOWN']
+    assert result.index.tolist() == [5, 6, 7]
@@ -1,6 +1,5 @@
 import sqlite3
 import json
-import shutil
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives.hashes import SHA256
 from cryptography.fernet import Fernet
@@ -12,9 +11,12 @@ import base64
 from pftpyclient.postfiatsecurity.hash_tools import derive_shared_secret
 import time
 import re
+import threading
+from contextlib import contextmanager, closing
 from xrpl.wallet import Wallet
 CREDENTIALS_DB = "credentials.sqlite"
 BACKUP_SUFFIX = ".sqlite_backup"
+SCHEMA_VERSION = 1  # stored in PRAGMA user_version once the tables exist
 
 KEY_EXPIRY = -1  # expiry in seconds, set to -1 for no expiration
 
@@ -27,6 +29,14 @@ def get_credentials_directory():
 def get_database_path():
     return get_credentials_directory() / CREDENTIALS_DB
 
+def connect_database(db_path=None, check_same_thread=True):
+    """Open a connection to the credentials database with WAL journaling enabled"""
+    conn = sqlite3.connect(db_path or get_database_path(), check_same_thread=check_same_thread)
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
+    return conn
+
 class CredentialManager:
     def __init__(self, username, password, allow_new_user=False):
         """Initialize CredentialManager
@@ -38,18 +48,43 @@ class CredentialManager:
         """
         self.postfiat_username = username.lower()
         self.db_path = get_database_path()
+        self._conn_local = threading.local()
+        self._connections = []  # every thread's open connection, so close() can reach all of them
+        self._connections_lock = threading.Lock()
         if not allow_new_user and not self.verify_password(password):
             raise ValueError("Invalid username or password")
         self.encryption_key = self._derive_encryption_key(password)
         self._key_expiry = time.time() + KEY_EXPIRY if KEY_EXPIRY >= 0 else float('inf')
         self._initialize_database()
         self.ecdh_public_key = None 
+        self._shared_secrets = {}  # counterparty ECDH key -> shared secret, so the seed isn't re-read per message
+
+    @contextmanager
+    def get_connection(self):
+        """Yield this thread's database connection, opening it on first use or after close().
+        Commits on success and rolls back on error, but leaves the connection open."""
+        conn = getattr(self._conn_local, 'conn', None)
+        with self._connections_lock:
+            if conn is None or conn not in self._connections:
+                # Each connection is only used by its own thread, but close() may run on another one
+                conn = connect_database(self.db_path, check_same_thread=False)
+                self._connections.append(conn)
+                self._conn_local.conn = conn
+        with conn:
+            yield conn
+
+    def close(self):
+        """Close the database connections opened by every thread"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
 
     def verify_password(self, password) -> bool:
         """Verify password by attempting to decrypt a known credential"""
         test_key = self._derive_encryption_key(password)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT encrypted_value FROM credentials 
@@ -70,7 +105,7 @@ class CredentialManager:
         self._check_key_expiry()
 
         key = f"{self.postfiat_username}__{credential_type}"
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT encrypted_value FROM credentials 
@@ -161,8 +196,11 @@ class CredentialManager:
             # Create a CredentialManager instance for the new user
             manager = cls(username=username, password=password, allow_new_user=True)
 
-            # Encrypt and store the credentials
-            manager.enter_and_encrypt_credential(credentials_dict=credentials)
+            # Encrypt and store the credentials, then close the temporary manager's connection
+            try:
+                manager.enter_and_encrypt_credential(credentials_dict=credentials)
+            finally:
+                manager.close()
 
             return f"User credentials encrypted using password and cached to {get_credentials_directory() / CREDENTIALS_DB}"
         
@@ -199,11 +237,11 @@ class CredentialManager:
                 logger.warning(f"Database does not exist at {db_path}")
                 return []
             
-            with sqlite3.connect(db_path) as conn:
+            with closing(connect_database(db_path)) as conn:
                 cursor = conn.cursor()
                 # Query distinct usernames from the credentials table
                 cursor.execute("SELECT DISTINCT username FROM credentials;")
-                usernames = [row[0] for row in cursor.fetchall()]
+                usernames = [row[0] for row in cursor]
 
             return sorted(usernames)
         
@@ -224,19 +262,19 @@ class CredentialManager:
     
     def _initialize_database(self):
         """Initialize the SQLite database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            # Create credentials table
-            cursor.execute("""
+        with self.get_connection() as conn:
+            # Skip schema setup if this database has already been initialized
+            if conn.execute("PRAGMA user_version;").fetchone()[0] >= SCHEMA_VERSION:
+                return
+
+            # Create credentials and contacts tables in a single call
+            conn.executescript("""
                 CREATE TABLE IF NOT EXISTS credentials (
                     username TEXT NOT NULL,
                     key TEXT NOT NULL,
                     encrypted_value TEXT NOT NULL,
                     PRIMARY KEY (username, key)
                 );
-            """)
-            # Create contacts table
-            cursor.execute("""
                 CREATE TABLE IF NOT EXISTS contacts (
                     username TEXT NOT NULL,
                     address TEXT NOT NULL,
@@ -244,7 +282,7 @@ class CredentialManager:
                     PRIMARY KEY (username, address)
                 );
             """)
-            conn.commit()
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
         logger.debug(f"Initialized database at {self.db_path}")
 
     def _encrypt_value(self, value):
@@ -259,24 +297,25 @@ class CredentialManager:
     
     def _decrypt_creds(self):
         """Retrieve and decrypt all credentials for the user"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT key, encrypted_value FROM credentials WHERE username = ?;
             """, (self.postfiat_username,))
-            rows = cursor.fetchall()
-        return {key: self._decrypt_value(value) for key, value in rows}
+            return {key: self._decrypt_value(value) for key, value in cursor}
     
     def enter_and_encrypt_credential(self, credentials_dict):
         """Encrypt and store multiple credentials"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
-            for key, value in credentials_dict.items():
-                encrypted_value = self._encrypt_value(value)
-                cursor.execute("""
-                    INSERT OR REPLACE INTO credentials (username, key, encrypted_value)
-                    VALUES (?, ?, ?);
-                """, (self.postfiat_username, key, encrypted_value))
+            rows = (
+                (self.postfiat_username, key, self._encrypt_value(value))
+                for key, value in credentials_dict.items()
+            )
+            cursor.executemany("""
+                INSERT OR REPLACE INTO credentials (username, key, encrypted_value)
+                VALUES (?, ?, ?);
+            """, rows)
             conn.commit()
             logger.info(f"Stored {len(credentials_dict)} credentials for {self.postfiat_username}")
 
@@ -291,24 +330,31 @@ class CredentialManager:
             self._backup_database()
             self.encryption_key = self._derive_encryption_key(new_password)
 
-            # Re-encrypt and store credentials 
-            self.enter_and_encrypt_credential(creds)
-
-            # Re-encrypt and store contacts
-            with sqlite3.connect(self.db_path) as conn:
+            # Re-encrypt credentials and contacts in one transaction so a failure can't leave them under different keys
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO credentials (username, key, encrypted_value)
+                    VALUES (?, ?, ?);
+                """, (
+                    (self.postfiat_username, key, self._encrypt_value(value))
+                    for key, value in creds.items()
+                ))
+
                 # First clear existing contacts
                 cursor.execute("""
                     DELETE FROM contacts WHERE username = ?;
                 """, (self.postfiat_username,))
 
                 # Re-insert contacts with newly encrypted names
-                for address, name in contacts.items():
-                    encrypted_name = self._encrypt_value(name)
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO contacts (username, address, name)
-                        VALUES (?, ?, ?);
-                    """, (self.postfiat_username, address, encrypted_name))
+                rows = (
+                    (self.postfiat_username, address, self._encrypt_value(name))
+                    for address, name in contacts.items()
+                )
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO contacts (username, address, name)
+                    VALUES (?, ?, ?);
+                """, rows)
                 conn.commit()
 
             logger.info(f"Password changed for {self.postfiat_username}")
@@ -327,11 +373,14 @@ class CredentialManager:
         if self.ecdh_public_key:
             self.ecdh_public_key = '0' * len(self.ecdh_public_key)
             self.ecdh_public_key = None
+        # Drop shared secrets cached for this session
+        self._shared_secrets.clear()
+        self.close()
 
     def delete_credentials(self):
         """Delete all credentials for the current user"""
         self._backup_database()
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             # Delete all credentials
             cursor.execute("""
@@ -346,15 +395,14 @@ class CredentialManager:
 
     def get_contacts(self):
         """Retrieve all contacts for the user"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 SELECT address, name FROM contacts WHERE username = ?;
             """, (self.postfiat_username,))
-            contacts = cursor.fetchall()
             return {
                 address: self._decrypt_value(name)
-                for address, name in contacts
+                for address, name in cursor
             }
 
     def save_contact(self, address, name):
@@ -367,7 +415,7 @@ class CredentialManager:
             raise ValueError(error_msg)
 
         encrypted_name = self._encrypt_value(name)
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 INSERT OR REPLACE INTO contacts (username, address, name)
@@ -378,7 +426,7 @@ class CredentialManager:
 
     def delete_contact(self, address):
         """Delete a contact"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
                 DELETE FROM contacts WHERE username = ? AND address = ?;
@@ -389,7 +437,9 @@ class CredentialManager:
     def _backup_database(self):
         """Create a backup of the current database"""
         backup_path = self.db_path.with_suffix(BACKUP_SUFFIX)
-        shutil.copy2(self.db_path, backup_path)
+        # Use the backup API so pages still in the WAL file are included
+        with self.get_connection() as source, closing(sqlite3.connect(backup_path)) as backup:
+            source.backup(backup)
         logger.info(f"Created backup of database at {backup_path}")
 
     def _get_raw_entropy(self):
@@ -411,8 +461,13 @@ class CredentialManager:
 
     def get_shared_secret(self, received_key):
         """Derive a shared secret using ECDH"""
-        raw_entropy = self._get_raw_entropy()
-        return derive_shared_secret(public_key_hex=received_key, seed_bytes=raw_entropy)
+        self._check_key_expiry()
+        shared_secret = self._shared_secrets.get(received_key)
+        if shared_secret is None:
+            raw_entropy = self._get_raw_entropy()
+            shared_secret = derive_shared_secret(public_key_hex=received_key, seed_bytes=raw_entropy)
+            self._shared_secrets[received_key] = shared_secret
+        return shared_secret
 
 class CredentialsExpiredError(Exception):
     """Exception raised when the encryption key has expired"""
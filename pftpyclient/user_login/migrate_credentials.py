@@ -110,10 +110,13 @@ class MigrationDialog(wx.Dialog):
 
             # Create new credential manager and store credentials
             new_creds = CredentialManager(username, password, allow_new_user=True)
-            new_creds.enter_and_encrypt_credential({
-                f"{username}__v1xrpaddress": address,
-                f"{username}__v1xrpsecret": secret
-            })
+            try:
+                new_creds.enter_and_encrypt_credential({
+                    f"{username}__v1xrpaddress": address,
+                    f"{username}__v1xrpsecret": secret
+                })
+            finally:
+                new_creds.close()
 
             self.move_to_next()
 
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional
+
+class EventLoopThread:
+    """Runs a single asyncio event loop forever on a daemon thread.
+    Synchronous code hands coroutines to it instead of spinning up (or nesting) a loop per call."""
+
+    def __init__(self, name: str = "xrpl-event-loop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedules a coroutine on the loop and returns a concurrent.futures.Future for its result"""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block on the event loop thread from inside one of its own coroutines")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+_loop_thread: Optional[EventLoopThread] = None
+_loop_thread_lock = threading.Lock()
+
+def get_event_loop_thread() -> EventLoopThread:
+    """Returns the shared event loop thread, starting it on first use"""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = EventLoopThread()
+        return _loop_thread
+
+def run_coroutine(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Runs a coroutine on the shared event loop and blocks until it returns or raises"""
+    return get_event_loop_thread().submit(coro).result(timeout)
@@ -6,6 +6,8 @@ import random
 import string
 import datetime
 import time
+import asyncio
+import dataclasses
 import json
 import ast
 from decimal import Decimal
@@ -15,18 +17,20 @@ from typing import Union, Optional
 import traceback
 from typing import List
 import math
+from functools import lru_cache
 
 # Third-party imports
 import xrpl
+import xrpl.asyncio
 from xrpl.models.requests import AccountTx
 from xrpl.models.transactions import Memo
 from xrpl.utils import str_to_hex
-import nest_asyncio
 import pandas as pd
 import numpy as np
 from loguru import logger
 import requests
 import brotli
+import dateutil.tz
 from cryptography.fernet import Fernet
 
 # PftPyclient imports
@@ -47,14 +51,48 @@ from pftpyclient.configuration.configuration import ConfigurationManager, get_ne
 from pftpyclient.configuration.constants import *
 import pftpyclient.configuration.constants as constants
 from pftpyclient.utilities.transaction_requirements import TransactionRequirementService
+from pftpyclient.utilities.event_loop import get_event_loop_thread, run_coroutine
 
-nest_asyncio.apply()
 
 SAVE_MEMO_TRANSACTIONS = True
 SAVE_TASKS = True
 SAVE_MEMOS = True
 SAVE_SYSTEM_MEMOS = True
 
+# Columns holding dicts that are stored as JSON strings in CSV caches
+CSV_JSON_COLUMNS = ['meta', 'tx_json', 'memo_data']
+
+# AccountTx fields kept in the transaction cache; the rest of each record (ledger_hash, close_time_iso, ctid) is unused
+TRANSACTION_COLUMNS = ['hash', 'ledger_index', 'tx_json', 'meta', 'validated']
+
+# Low-cardinality string columns are stored as categoricals with fixed categories, so that frames from separate syncs concat without falling back to object
+DIRECTION_DTYPE = pd.CategoricalDtype(['INCOMING', 'OUTGOING'])
+TASK_TYPE_DTYPE = pd.CategoricalDtype([task_type.name for task_type in TaskType] + ['UNKNOWN'])
+
+# Prefix of a chunked memo's full_output, capturing the chunk number
+CHUNK_PREFIX_PATTERN = re.compile(r'^chunk_(\d+)__')
+
+# Classic XRP address, as written at the top of a user's context doc
+XRP_ADDRESS_PATTERN = re.compile(r'r[1-9A-HJ-NP-Za-km-z]{25,34}')
+
+# Characters allowed in a compressed (Base64) memo payload
+BASE64_CHARS = frozenset(string.ascii_letters + string.digits + '+/=')
+
+# Ripple epoch (January 1, 2000 00:00 UTC) in Unix seconds
+RIPPLE_EPOCH_OFFSET = 946684800
+
+# Task and message IDs look like 2024-01-01_12:00, optionally followed by __ABCD
+TASK_ID_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}_\d{2}:\d{2}(?:__[A-Z0-9]{4})?')
+
+# Seconds between validation polls for submitted memo chunks, roughly one ledger close
+LEDGER_POLL_INTERVAL = 1
+
+# Preliminary submit results that mean a chunk was applied or queued and its sequence number will be used
+SUBMIT_ACCEPTED_PREFIXES = ('tes', 'ter', 'tec')
+
+# Google Doc exports share one pooled session so repeat fetches reuse the TLS connection
+_DOC_SESSION = requests.Session()
+
 class PostFiatTaskManager:
     
     def __init__(self, username, password, network_url, config: ConfigurationManager):
@@ -79,15 +117,17 @@ class PostFiatTaskManager:
         
         # initialize dataframes for caching
         self.transactions = pd.DataFrame()
+        self.transaction_hashes = set()  # hashes already in self.transactions, so syncs only handle the delta
         self.memo_transactions = pd.DataFrame()
         self.tasks = pd.DataFrame()
         self.memos = pd.DataFrame()
         self.system_memos = pd.DataFrame()
 
+        self._task_index_cache = (None, {})  # (tasks frame the index was built from, task_id -> row positions)
         self.handshake_cache = {}  # Address -> (handshake_sent, received_key)
 
-        # Initialize client for blockchain queries
-        self.client = xrpl.clients.JsonRpcClient(self.network_url)
+        # Initialize client for blockchain queries. Requests run on the shared event loop thread via run_coroutine
+        self.client = xrpl.asyncio.clients.AsyncJsonRpcClient(self.network_url)
         
         # Initialize transactions
         self.sync_transactions()
@@ -106,17 +146,16 @@ class PostFiatTaskManager:
     def determine_wallet_state(self) -> bool:
         """Determine the current state of the wallet based on blockhain"""
         logger.debug(f"Determining wallet state for {self.user_wallet.classic_address}")
-        client = xrpl.clients.JsonRpcClient(self.network_url)
         new_state = self.wallet_state
 
         try:
             # Check if account exists on XRPL
-            response = client.request(
+            response = run_coroutine(self.client.request(
                 xrpl.models.requests.AccountInfo(
                     account=self.user_wallet.classic_address,
                     ledger_index="validated"
                 )
-            )
+            ))
 
             if response.is_successful() and 'account_data' in response.result:
                 balance = int(response.result['account_data']['Balance'])
@@ -199,7 +238,7 @@ class PostFiatTaskManager:
             else:
                 final_path = f"{base_path}.csv"
                 temp_path = f"{final_path}.tmp"
-                df.to_csv(temp_path, index=False)
+                serialize_csv_columns(df).to_csv(temp_path, index=False)
 
             # Rplace existing file if save was successful
             os.replace(temp_path, final_path)
@@ -214,8 +253,37 @@ class PostFiatTaskManager:
         except Exception as e:
             logger.error(f"Unexpected error saving {description} to {filepath}: {e}")
 
+    def append_to_csv(self, df, filepath, description) -> bool:
+        """
+        Appends rows to an existing CSV cache instead of rewriting the whole file.
+        Returns False if the rows could not be appended and a full save is needed.
+        """
+        if self.config.get_global_config('transaction_cache_format') == 'pickle':
+            return False
+        
+        final_path = f"{os.path.splitext(filepath)[0]}.csv"
+        if not os.path.exists(final_path):
+            return False
+
+        try:
+            # Rows must line up with the existing header
+            columns = pd.read_csv(final_path, nrows=0).columns
+            if not set(df.columns).issubset(columns):
+                return False
+            
+            serialize_csv_columns(df).reindex(columns=columns).to_csv(final_path, mode='a', header=False, index=False)
+            logger.info(f"Appended {len(df)} {description} to {final_path}")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error appending {description} to {final_path}, falling back to full save: {e}")
+            return False
+
     @PerformanceMonitor.measure('save_transactions')
-    def save_transactions(self):
+    def save_transactions(self, new_tx_df=None):
+        """Saves the transaction cache. If new_tx_df is given, tries to append just those rows first"""
+        if new_tx_df is not None and self.append_to_csv(new_tx_df, self.tx_history_filepath, "transactions"):
+            return
         self.save_dataframe(self.transactions, self.tx_history_filepath, "transactions")
 
     @PerformanceMonitor.measure('save_memo_transactions')
@@ -258,7 +326,10 @@ class PostFiatTaskManager:
                     # deserialize columns for CSV
                     for col in ['meta', 'tx_json']:
                         if col in tx_df.columns:
-                            tx_df[col] = tx_df[col].apply(lambda x: ast.literal_eval(x) if pd.notna(x) else x)
+                            tx_df[col] = tx_df[col].map(deserialize_csv_value)
+
+                    # appended batches can overlap with rows already in the file
+                    tx_df = tx_df.drop_duplicates(subset=['hash'], ignore_index=True)
 
             except pd.errors.EmptyDataError:
                 logger.warning(f"The file {file_path} is empty. Creating a new DataFrame.")
@@ -276,11 +347,10 @@ class PostFiatTaskManager:
         logger.warning(f"No existing transaction history file found at {self.tx_history_filepath}")
         return pd.DataFrame() # empty dataframe if file does not exist
     
-    @PerformanceMonitor.measure('get_new_transactions')
-    def get_new_transactions(self, last_known_ledger_index):
-        """Retrieves new transactions from the node after the last known transaction date"""
+    def iter_new_transaction_pages(self, last_known_ledger_index):
+        """Yields pages of new transactions from the node after the last known ledger index"""
         logger.debug(f"Getting new transactions after ledger index {last_known_ledger_index}")
-        return self.get_account_transactions(
+        return self.iter_account_transaction_pages(
             account_address=self.user_wallet.classic_address,
             ledger_index_min=last_known_ledger_index,
             ledger_index_max=-1,
@@ -295,9 +365,9 @@ class PostFiatTaskManager:
         # Check if account exists and is funded before proceeding
         try:
             # Get server state to determine available ledger range
-            server_state = self.client.request(
+            server_state = run_coroutine(self.client.request(
                 xrpl.models.requests.ServerState()
-            )
+            ))
             if server_state.is_successful():
                 complete_ledgers = server_state.result['state']['complete_ledgers']
                 # complete_ledgers is typically returned as a string like "32570-94329899"
@@ -310,12 +380,12 @@ class PostFiatTaskManager:
                 logger.debug("Could not fetch server state")
                 return False
             
-            response = self.client.request(
+            response = run_coroutine(self.client.request(
                 xrpl.models.requests.AccountInfo(
                     account=self.user_wallet.classic_address,
                     ledger_index="validated"
                 )
-            )
+            ))
             if not response.is_successful():
                 logger.debug("Account not found or not funded, skipping transaction sync")
                 return False
@@ -331,6 +401,7 @@ class PostFiatTaskManager:
                 if not loaded_tx_df.empty:
                     logger.debug(f"Loaded {len(loaded_tx_df)} transactions from {self.tx_history_filepath}")
                     self.transactions = loaded_tx_df
+                    self.transaction_hashes = set(loaded_tx_df['hash'])
                     self.sync_memo_transactions(loaded_tx_df)
 
             # Log local ledger index range
@@ -349,22 +420,28 @@ class PostFiatTaskManager:
                 next_ledger_index = self.transactions['ledger_index'].max() + 1
                 logger.debug(f"Next ledger index: {next_ledger_index}")
 
-            # fetch new transactions from the node
-            new_transactions = self.get_new_transactions(next_ledger_index)
-            
-            # Convert list of transactions to DataFrame
-            if new_transactions and len(new_transactions) > 0:  # Check if list is not empty
-                new_tx_df = pd.DataFrame(new_transactions)
-                logger.debug(f"Adding {len(new_tx_df)} new transactions...")
-                
-                # Add new transactions to the dataframe
-                self.transactions = pd.concat([self.transactions, new_tx_df], ignore_index=True).drop_duplicates(subset=['hash'])
-                self.save_transactions()
-                self.sync_memo_transactions(new_tx_df)
-                return True
-            else:
+            # fetch new transactions from the node page by page, filtering each page while the next one downloads
+            new_transactions = []
+            for page in self.iter_new_transaction_pages(next_ledger_index):
+                # keep only transactions not already cached
+                for tx in page:
+                    if tx['hash'] not in self.transaction_hashes:
+                        self.transaction_hashes.add(tx['hash'])
+                        new_transactions.append(tx)
+
+            if not new_transactions:
                 logger.debug("No new transactions found. Finished updating local tx history")
                 return False
+
+            # Convert list of transactions to DataFrame
+            new_tx_df = pd.DataFrame.from_records(new_transactions, columns=TRANSACTION_COLUMNS)
+            logger.debug(f"Adding {len(new_tx_df)} new transactions...")
+
+            # Add new transactions to the dataframe and save the caches once for the whole sync, not once per page
+            self.transactions = pd.concat([self.transactions, new_tx_df], ignore_index=True)
+            self.save_transactions(new_tx_df)
+            self.sync_memo_transactions(new_tx_df)
+            return True
                 
         except (TypeError, AttributeError) as e:
             logger.error(f"Error processing transaction history: {e}")
@@ -379,6 +456,7 @@ class PostFiatTaskManager:
 
             # Reset dataframes
             self.transactions = pd.DataFrame()
+            self.transaction_hashes = set()
             self.memo_transactions = pd.DataFrame()
             self.tasks = pd.DataFrame()
             self.memos = pd.DataFrame()
@@ -398,52 +476,65 @@ class PostFiatTaskManager:
             return
 
         # flag rows with memos
-        new_tx_df['has_memos'] = new_tx_df['tx_json'].apply(lambda x: 'Memos' in x)
+        new_tx_df['has_memos'] = ['Memos' in tx_json for tx_json in new_tx_df['tx_json'].to_numpy()]
 
         # filter for rows with memos and convert to dataframe
-        memo_tx_df = new_tx_df[new_tx_df['has_memos']== True].copy()
+        memo_tx_df = new_tx_df[new_tx_df['has_memos']].copy()
+
+        # Skip memos that were already processed, e.g. transactions first delivered over the websocket.
+        # Everything below then only sees new hashes, so the derived dataframes need no deduplication
+        if not self.memo_transactions.empty:
+            memo_tx_df = memo_tx_df[~memo_tx_df['hash'].isin(self.memo_transactions['hash'])].copy()
         
         # Guard against no memos found
         if memo_tx_df.empty or len(memo_tx_df) == 0:
-            logger.debug("No transactions with memos found")
+            logger.debug("No new transactions with memos found")
             return
 
         # Continue with processing only if we have memos
         try:
-            # Extract first memo into a new column, serialize to dict
-            memo_tx_df['memo_data'] = memo_tx_df['tx_json'].apply(
-                lambda x: self.decode_memo_fields_to_dict(x['Memos'][0]['Memo'])
+            # Decode the first memo and extract the other tx_json fields in one pass over the batch.
+            # ledger_index comes from tx_json when present, otherwise from the root level
+            decode_memo = self.decode_memo_fields_to_dict
+            root_ledger_indexes = (
+                memo_tx_df['ledger_index'] if 'ledger_index' in memo_tx_df.columns 
+                else [0] * len(memo_tx_df)
             )
-            
-            # Extract account and destination
-            memo_tx_df['account'] = memo_tx_df['tx_json'].apply(lambda x: x['Account'])
-            memo_tx_df['destination'] = memo_tx_df['tx_json'].apply(lambda x: x['Destination'])
+            memo_data, task_ids, full_outputs, accounts, destinations, dates, ledger_indexes = [], [], [], [], [], [], []
+            for tx_json, root_ledger_index in zip(memo_tx_df['tx_json'], root_ledger_indexes):
+                decoded_memo = decode_memo(tx_json['Memos'][0]['Memo'])
+                memo_data.append(decoded_memo)
+                task_ids.append(decoded_memo['task_id'])
+                full_outputs.append(decoded_memo['full_output'])
+                accounts.append(tx_json['Account'])
+                destinations.append(tx_json['Destination'])
+                dates.append(tx_json['date'])
+                ledger_indexes.append(int(tx_json.get('ledger_index', root_ledger_index)))
+
+            memo_tx_df['memo_data'] = memo_data
+            # The most read memo fields also get their own columns, so filters scan a column instead of digging into each dict
+            memo_tx_df['task_id'] = task_ids
+            memo_tx_df['full_output'] = full_outputs
+            memo_tx_df['account'] = accounts
+            memo_tx_df['destination'] = destinations
+            memo_tx_df['ledger_index'] = ledger_indexes
             
             # Determine direction
-            memo_tx_df['direction'] = np.where(
-                memo_tx_df['destination']==self.user_wallet.classic_address, 
-                'INCOMING',
-                'OUTGOING'
-            )
-            
-            # Derive counterparty address
-            memo_tx_df['counterparty_address'] = memo_tx_df[['destination','account']].sum(1).apply(
-                lambda x: str(x).replace(self.user_wallet.classic_address,'')
-            )
+            is_incoming = memo_tx_df['destination'].to_numpy() == self.user_wallet.classic_address
+            memo_tx_df['direction'] = pd.Categorical.from_codes(np.where(is_incoming, 0, 1), dtype=DIRECTION_DTYPE)
             
-            # Convert ripple timestamp to datetime
-            memo_tx_df['datetime'] = memo_tx_df['tx_json'].apply(
-                lambda x: self.convert_ripple_timestamp_to_datetime(x['date'])
+            # Derive counterparty address: the sender for incoming memos, the recipient for outgoing ones
+            memo_tx_df['counterparty_address'] = np.where(
+                is_incoming,
+                memo_tx_df['account'].to_numpy(),
+                memo_tx_df['destination'].to_numpy()
             )
             
-            # Get ledger_index from either tx_json or root level
-            memo_tx_df['ledger_index'] = memo_tx_df.apply(
-                lambda row: int(row['tx_json'].get('ledger_index', row.get('ledger_index', 0))), 
-                axis=1
-            )
+            # Convert ripple timestamps to datetimes for the whole batch at once
+            memo_tx_df['datetime'] = self.convert_ripple_timestamps_to_datetimes(dates)
 
             # Flag rows with PFT
-            memo_tx_df['is_pft'] = memo_tx_df['tx_json'].apply(is_pft_transaction)
+            memo_tx_df['is_pft'] = [is_pft_transaction(tx_json) for tx_json in memo_tx_df['tx_json'].to_numpy()]
 
             # Update memo_transactions DataFrame
             if not memo_tx_df.empty and len(memo_tx_df) > 0:
@@ -453,7 +544,7 @@ class PostFiatTaskManager:
                     self.memo_transactions = pd.concat(
                         [self.memo_transactions, memo_tx_df], 
                         ignore_index=True
-                    ).drop_duplicates(subset=['hash'])
+                    )
 
                 logger.debug(f"Added {len(memo_tx_df)} memos to local memos dataframe")
 
@@ -461,61 +552,61 @@ class PostFiatTaskManager:
                 if SAVE_MEMO_TRANSACTIONS:
                     self.save_memo_transactions()
 
-                # Process derived data
-                self.sync_tasks(memo_tx_df)
-                self.sync_memos(memo_tx_df)
+                # Process derived data. Tasks and messages both need a valid ID, so filter once for both
+                valid_id_df = memo_tx_df[[is_valid_id(memo_data) for memo_data in memo_tx_df['memo_data'].to_numpy()]]
+                self.sync_tasks(valid_id_df)
+                self.sync_memos(valid_id_df)
                 self.sync_system_memos(memo_tx_df)
 
         except Exception as e:
             logger.error(f"Error processing memo transactions: {e}")
             logger.error(traceback.format_exc())
 
+    @staticmethod
+    def _format_display_addresses(addresses: pd.Series, contact_names: pd.Series) -> list:
+        """Returns 'name (address)' where a contact name is known and the bare address otherwise.
+        Zips the two columns directly rather than building a row Series per address with apply(axis=1)"""
+        return [
+            f"{contact_name} ({address})" if pd.notna(contact_name) else address
+            for address, contact_name in zip(addresses.to_numpy(), contact_names.to_numpy())
+        ]
+
+    @staticmethod
+    def _expand_memo_data(memo_tx_df, fields_to_add):
+        """Returns a dataframe with a column per memo_data key, followed by the given transaction columns.
+        Columns are copied whole rather than merged into each memo_data dict row by row"""
+        expanded_df = pd.DataFrame(memo_tx_df['memo_data'].tolist())
+        for field in fields_to_add:
+            if field in memo_tx_df.columns:
+                expanded_df[field] = memo_tx_df[field].to_numpy()
+        return expanded_df
+
     @PerformanceMonitor.measure('sync_tasks')
     def sync_tasks(self, new_memo_tx_df):
         """ Updates the tasks dataframe with new tasks from the new memos.
+        Expects memos already filtered to those with a valid ID pattern.
         Task dataframe contains columns: user,task_id,full_output,hash,counterparty_address,datetime,task_type"""
         logger.debug(f"Syncing tasks")
         if new_memo_tx_df.empty or len(new_memo_tx_df) == 0:
-            logger.debug("No new memos to process for tasks")
-            return
-
-        # Filter for memos that have a valid ID pattern 
-        valid_id_df = new_memo_tx_df[
-            new_memo_tx_df['memo_data'].apply(is_valid_id)
-        ].copy()
-
-        if valid_id_df.empty or len(valid_id_df) == 0:
-            logger.debug("No memos with valid IDs found")
+            logger.debug("No new memos with valid IDs to process for tasks")
             return
 
         # Filter for task-specific content
-        task_df = valid_id_df[
-            valid_id_df['memo_data'].apply(lambda x: any(
-                task_indicator in str(x['full_output'])
-                for task_indicator in TASK_INDICATORS
-            ))
-        ].copy()
+        task_df = new_memo_tx_df[[
+            any(task_indicator in str(full_output) for task_indicator in TASK_INDICATORS)
+            for full_output in new_memo_tx_df['full_output'].to_numpy()
+        ]]
 
         if task_df.empty or len(task_df) == 0:
             logger.debug("No task-related memos found")
             return
 
-        # Enrich memo_data with transaction metadata
-        fields_to_add = ['hash','counterparty_address','datetime']
-        task_df['memo_data'] = task_df.apply(
-            lambda row: {
-                **row['memo_data'], 
-                **{field: row[field] for field in fields_to_add if field in row}
-            } # ** is used to unpack the dictionaries
-            , axis=1
-        ).copy()
+        # Convert the memo_data to a dataframe enriched with transaction metadata, and add the task type
+        task_df = self._expand_memo_data(task_df, ['hash','counterparty_address','datetime'])
+        task_df['task_type'] = classify_task_strings(task_df['full_output'])
 
-        # Convert the memo_data to a dataframe and add the task type
-        task_df = pd.DataFrame(task_df['memo_data'].tolist())
-        task_df['task_type'] = task_df['full_output'].apply(classify_task_string)
-
-        # Concatenate new tasks to existing tasks and drop duplicates
-        self.tasks = pd.concat([self.tasks, task_df], ignore_index=True).drop_duplicates(subset=['hash'])
+        # Concatenate new tasks to existing tasks
+        self.tasks = pd.concat([self.tasks, task_df], ignore_index=True)
 
         # for debugging purposes only
         if SAVE_TASKS:
@@ -523,45 +614,25 @@ class PostFiatTaskManager:
 
     @PerformanceMonitor.measure('sync_memos')
     def sync_memos(self, new_memo_tx_df):
-        """Updates messages dataframe with P2P message data"""
+        """Updates messages dataframe with P2P message data.
+        Expects memos already filtered to those with a valid ID pattern."""
         logger.debug(f"Syncing memos")
         if new_memo_tx_df.empty or len(new_memo_tx_df) == 0:
-            logger.debug("No new memos to process for messages")
-            return
-        
-        # Filter for valid IDs first
-        valid_id_df = new_memo_tx_df[
-            new_memo_tx_df['memo_data'].apply(is_valid_id)
-        ].copy()
-
-        if valid_id_df.empty or len(valid_id_df) == 0:
-            logger.debug("No memos with valid IDs found")
+            logger.debug("No new memos with valid IDs to process for messages")
             return
 
         # Filter for message-specific content
-        memo_df = valid_id_df[
-            valid_id_df['memo_data'].apply(lambda x: any(
-                message_indicator in str(x['full_output'])
-                for message_indicator in MESSAGE_INDICATORS
-            ))
-        ].copy()
+        memo_df = new_memo_tx_df[[
+            any(message_indicator in str(full_output) for message_indicator in MESSAGE_INDICATORS)
+            for full_output in new_memo_tx_df['full_output'].to_numpy()
+        ]]
 
         if memo_df.empty or len(memo_df) == 0:
             logger.debug("No message-related memos found")
             return
         
-        # Enrich memo_data with transaction metadata
-        fields_to_add = ['hash','counterparty_address','datetime', 'direction']
-        memo_df['memo_data'] = memo_df.apply(
-            lambda row: {
-                **row['memo_data'], 
-                **{field: row[field] for field in fields_to_add if field in row}
-            }, 
-            axis=1
-        ).copy()
-
-        # Convert memo_data to new dataframe with all fields
-        memo_df = pd.DataFrame(memo_df['memo_data'].tolist())
+        # Convert memo_data to new dataframe enriched with transaction metadata
+        memo_df = self._expand_memo_data(memo_df, ['hash','counterparty_address','datetime', 'direction'])
 
         # Process chunked messages, etc.
         self.memos = pd.concat([self.memos, memo_df], ignore_index=True)
@@ -578,47 +649,44 @@ class PostFiatTaskManager:
             return
         
         # Filter for system message types
-        system_df = new_memo_tx_df[
-            new_memo_tx_df['memo_data'].apply(lambda x: any(
-                indicator in str(x['task_id'])
-                for indicator in SYSTEM_MEMO_TYPES
-            ))
-        ].copy()
+        system_df = new_memo_tx_df[[
+            any(indicator in str(task_id) for indicator in SYSTEM_MEMO_TYPES)
+            for task_id in new_memo_tx_df['task_id'].to_numpy()
+        ]]
 
         if system_df.empty or len(system_df) == 0:
             logger.debug("No system messages found")
             return
 
-        # Enrich memo_data with transaction metadata
-        fields_to_add = ['hash', 'counterparty_address', 'datetime', 'direction']
-        system_df['memo_data'] = system_df.apply(
-            lambda row: {
-                **row['memo_data'],
-                **{field: row[field] for field in fields_to_add if field in row}
-            },
-            axis=1
-        ).copy()
-
-        # Convert memo_data to new dataframe with all fields
-        system_df = pd.DataFrame(system_df['memo_data'].tolist())
+        # Convert memo_data to new dataframe enriched with transaction metadata
+        system_df = self._expand_memo_data(system_df, ['hash', 'counterparty_address', 'datetime', 'direction'])
 
-        # Update system_memos dataframe with deduplication
+        # Update system_memos dataframe
         self.system_memos = pd.concat(
             [self.system_memos, system_df], 
             ignore_index=True
-        ).drop_duplicates(subset=['hash'])
+        )
 
         logger.debug(f"Added {len(system_df)} new system messages")
 
         if SAVE_SYSTEM_MEMOS: 
             self.save_system_memos()
 
+    def _get_task_index(self):
+        """ Returns a task_id -> row positions mapping for self.tasks.
+        Cached against the frame object itself, so it is rebuilt only after sync_tasks replaces self.tasks """
+        cached_tasks, task_index = self._task_index_cache
+        if cached_tasks is not self.tasks:
+            task_index = self.tasks.groupby('task_id', sort=False).indices if not self.tasks.empty else {}
+            self._task_index_cache = (self.tasks, task_index)
+        return task_index
+
     def get_task(self, task_id):
         """ Returns the task dataframe for a given task ID """
-        task_df = self.tasks[self.tasks['task_id'] == task_id]
-        if task_df.empty or len(task_df) == 0:
+        positions = self._get_task_index().get(task_id)
+        if positions is None or len(positions) == 0:
             raise NoMatchingTaskException(f"No task found with task_id {task_id}")
-        return task_df
+        return self.tasks.iloc[positions]
     
     def get_memo(self, memo_id):
         """Returns the memo dataframe for a given memo ID """
@@ -636,25 +704,44 @@ class PostFiatTaskManager:
         if task_df['task_id'].nunique() != 1:
             raise ValueError("The task_id column must contain only one unique value")
         
-        return task_df.sort_values(by='datetime').iloc[-1]['task_type']
+        # Most recent row wins; scanning in reverse makes ties go to the later row, as a stable sort would
+        return task_df.at[task_df['datetime'].iloc[::-1].idxmax(), 'task_type']
     
     def get_task_state_using_task_id(self, task_id):
         """ Returns the latest state of a task given a task ID """
         return self.get_task_state(self.get_task(task_id))
 
+    def get_latest_task_states(self):
+        """ Returns a Series mapping every task_id to its latest task_type, as get_task_state would for each task """
+        if self.tasks.empty:
+            return pd.Series(dtype=object)
+        # A stable sort keeps ties in row order, so the last row per task matches get_task_state
+        return self.tasks.sort_values(by='datetime', kind='stable').groupby('task_id', sort=False)['task_type'].last()
+
     def convert_ripple_timestamp_to_datetime(self, ripple_timestamp = 768602652):
-        ripple_epoch_offset = 946684800  # January 1, 2000 (00:00 UTC)
-        
-        
-        unix_timestamp = ripple_timestamp + ripple_epoch_offset
+        unix_timestamp = ripple_timestamp + RIPPLE_EPOCH_OFFSET
         date_object = datetime.datetime.fromtimestamp(unix_timestamp)
         return date_object
 
+    @staticmethod
+    def convert_ripple_timestamps_to_datetimes(ripple_timestamps) -> pd.DatetimeIndex:
+        """Vectorized convert_ripple_timestamp_to_datetime: naive local times, matching datetime.fromtimestamp"""
+        unix_timestamps = np.asarray(ripple_timestamps, dtype=np.int64) + RIPPLE_EPOCH_OFFSET
+        return (
+            pd.to_datetime(unix_timestamps, unit='s', utc=True)
+            .tz_convert(dateutil.tz.tzlocal())
+            .tz_localize(None)
+        )
+
     @staticmethod
     def hex_to_text(hex_string):
-        bytes_object = bytes.fromhex(hex_string)
-        ascii_string = bytes_object.decode("utf-8")
-        return ascii_string
+        return bytes.fromhex(hex_string).decode("utf-8")
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _hex_to_text_cached(hex_string):
+        """hex_to_text for short, highly repetitive fields like MemoFormat and MemoType"""
+        return PostFiatTaskManager.hex_to_text(hex_string)
     
     @staticmethod
     def generate_custom_id():
@@ -686,21 +773,15 @@ class PostFiatTaskManager:
         # TODO: Remove key changes and rely on MemoFormat, MemoType, MemoData to avoid confusion from context-switching
         # Handle xrpl.models.transactions.Memo objects
         if hasattr(memo, 'memo_format'):  # This is a Memo object
-            fields = {
-                'user': memo.memo_format,
-                'task_id': memo.memo_type,
-                'full_output': memo.memo_data
-            }
+            user, task_id, full_output = memo.memo_format, memo.memo_type, memo.memo_data
         else:  # This is a dictionary from transaction JSON
-            fields = {
-                'user': memo.get('MemoFormat', ''),
-                'task_id': memo.get('MemoType', ''),
-                'full_output': memo.get('MemoData', '')
-            }
+            user, task_id, full_output = memo.get('MemoFormat'), memo.get('MemoType'), memo.get('MemoData')
         
+        # user and task_id repeat across most transactions, so only those are cached
         return {
-            key: PostFiatTaskManager.hex_to_text(value or '')
-            for key, value in fields.items()
+            'user': PostFiatTaskManager._hex_to_text_cached(user) if user else '',
+            'task_id': PostFiatTaskManager._hex_to_text_cached(task_id) if task_id else '',
+            'full_output': PostFiatTaskManager.hex_to_text(full_output) if full_output else ''
         }
 
     def spawn_user_wallet(self):
@@ -726,9 +807,12 @@ class PostFiatTaskManager:
             # Split amount by number of chunks
             amount_per_chunk = amount / len(chunked_memo)
 
-            # Send each chunk in a separate transaction
-            for memo_chunk in chunked_memo:
-                response.append(self._send_pft_single(amount_per_chunk, destination, memo_chunk))
+            # Send each chunk in a separate transaction, submitted in sequence order
+            payments = [
+                self._build_pft_payment(amount_per_chunk, destination, memo_chunk)
+                for memo_chunk in chunked_memo
+            ]
+            response = self._submit_chunk_payments(payments)
         
         else:
             logger.debug("Memo is under 1 KB, sending in a single transaction")
@@ -738,7 +822,29 @@ class PostFiatTaskManager:
 
     def _send_pft_single(self, amount, destination, memo):
         """Helper method to send a single PFT transaction"""
-        client = xrpl.clients.JsonRpcClient(self.network_url)
+        payment = self._build_pft_payment(amount, destination, memo)
+
+        # Sign the transaction to get the hash
+        # We need to derive the hash because the submit_and_wait function doesn't return a hash if transaction fails
+        # TODO: tx_hash does not match the hash in the response
+        # signed_tx = xrpl.transaction.sign(payment, self.user_wallet)
+        # tx_hash = signed_tx.get_hash()
+
+        try:
+            logger.debug("Submitting and waiting for transaction")
+            response = run_coroutine(xrpl.asyncio.transaction.submit_and_wait(payment, self.client, self.user_wallet))    
+        except xrpl.transaction.XRPLReliableSubmissionException as e:
+            response = f"Transaction submission failed: {e}"
+            logger.error(response)
+        except Exception as e:
+            response = f"Unexpected error: {e}"
+            logger.error(response)
+            logger.error(traceback.format_exc())
+
+        return response
+
+    def _build_pft_payment(self, amount, destination, memo):
+        """Builds an unsigned PFT payment carrying a single memo"""
 
         # Handle memo
         if isinstance(memo, Memo):
@@ -755,31 +861,102 @@ class PostFiatTaskManager:
             value=str(amount)
         )
 
-        payment = xrpl.models.transactions.Payment(
+        return xrpl.models.transactions.Payment(
             account=self.user_wallet.address,
             amount=amount_to_send,
             destination=destination,
             memos=memos,
         )
 
-        # Sign the transaction to get the hash
-        # We need to derive the hash because the submit_and_wait function doesn't return a hash if transaction fails
-        # TODO: tx_hash does not match the hash in the response
-        # signed_tx = xrpl.transaction.sign(payment, self.user_wallet)
-        # tx_hash = signed_tx.get_hash()
+    def _submit_chunk_payments(self, payments):
+        """Submits chunk payments one after another in sequence order and waits for their validation together.
+        Returns a list of responses in the same order, with failures as error strings like the single-send helpers.
+        Once a chunk fails without using its sequence number, the later chunks cannot apply and are reported as failed"""
+        return run_coroutine(self._submit_chunk_payments_async(payments))
 
+    async def _submit_chunk_payments_async(self, payments):
+        """Assigns consecutive sequence numbers and submits each chunk only after the previous one was accepted"""
         try:
-            logger.debug("Submitting and waiting for transaction")
-            response = xrpl.transaction.submit_and_wait(payment, client, self.user_wallet)    
-        except xrpl.transaction.XRPLReliableSubmissionException as e:
-            response = f"Transaction submission failed: {e}"
-            logger.error(response)
+            sequence = await xrpl.asyncio.account.get_next_valid_seq_number(self.user_wallet.address, self.client)
         except Exception as e:
-            response = f"Unexpected error: {e}"
-            logger.error(response)
-            logger.error(traceback.format_exc())
+            error = self._format_submission_error(e)
+            return [error] * len(payments)
 
-        return response
+        total = len(payments)
+        responses = [None] * total
+        pending = []
+        failed_idx = None
+
+        for idx, payment in enumerate(payments):
+            try:
+                sequenced_payment = dataclasses.replace(payment, sequence=sequence + idx)
+                signed_payment = await xrpl.asyncio.transaction.autofill_and_sign(sequenced_payment, self.client, self.user_wallet)
+                logger.debug(f"Submitting chunk {idx+1} of {total} with sequence {sequence + idx}")
+                submit_response = await xrpl.asyncio.transaction.submit(signed_payment, self.client)
+                prelim_result = submit_response.result["engine_result"]
+                if not prelim_result.startswith(SUBMIT_ACCEPTED_PREFIXES):
+                    raise xrpl.asyncio.transaction.XRPLReliableSubmissionException(
+                        f"{prelim_result}: {submit_response.result['engine_result_message']}"
+                    )
+            except Exception as e:
+                responses[idx] = self._format_submission_error(e)
+                failed_idx = idx
+                break
+            pending.append((idx, asyncio.create_task(self._wait_for_validation(signed_payment, prelim_result))))
+
+        for idx, task in pending:
+            if failed_idx is not None and idx > failed_idx:
+                task.cancel()
+                continue
+            try:
+                responses[idx] = await task
+            except Exception as e:
+                responses[idx] = self._format_submission_error(e)
+                # A chunk that expired never used its sequence number, so no later chunk can validate
+                if isinstance(e, TransactionExpiredException):
+                    failed_idx = idx
+
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+        if failed_idx is not None:
+            for idx in range(failed_idx + 1, total):
+                responses[idx] = (
+                    f"Transaction submission failed: chunk {idx+1} of {total} was not applied "
+                    f"because chunk {failed_idx+1} failed"
+                )
+                logger.error(responses[idx])
+
+        return responses
+
+    async def _wait_for_validation(self, signed_payment, prelim_result):
+        """Polls until a submitted payment is in a validated ledger or its LastLedgerSequence has passed"""
+        tx_hash = signed_payment.get_hash()
+        while True:
+            await asyncio.sleep(LEDGER_POLL_INTERVAL)
+            latest_ledger = await xrpl.asyncio.ledger.get_latest_validated_ledger_sequence(self.client)
+            response = await self.client.request(xrpl.models.requests.Tx(transaction=tx_hash))
+
+            if response.is_successful():
+                if response.result.get("validated"):
+                    return_code = response.result["meta"]["TransactionResult"]
+                    if return_code != "tesSUCCESS":
+                        raise xrpl.asyncio.transaction.XRPLReliableSubmissionException(f"Transaction failed: {return_code}")
+                    return response
+            elif response.result.get("error") != "txnNotFound":
+                raise xrpl.asyncio.clients.XRPLRequestFailureException(response.result)
+
+            if latest_ledger >= signed_payment.last_ledger_sequence:
+                raise TransactionExpiredException(latest_ledger, signed_payment.last_ledger_sequence, prelim_result)
+
+    @staticmethod
+    def _format_submission_error(error):
+        """Formats a submission error the same way as the single-send helpers"""
+        if isinstance(error, xrpl.asyncio.transaction.XRPLReliableSubmissionException):
+            message = f"Transaction submission failed: {error}"
+        else:
+            message = f"Unexpected error: {error}"
+        logger.error(message)
+        return message
     
     def handshake_sent(self):
         """Checks if the user has sent a handshake to the node"""
@@ -801,7 +978,7 @@ class PostFiatTaskManager:
         
         # Get all handshakes (both incoming and outgoing)
         handshakes = self.system_memos[
-            self.system_memos['task_id'].str.contains(SystemMemoType.HANDSHAKE.value, na=False)
+            self.system_memos['task_id'].str.contains(SystemMemoType.HANDSHAKE.value, na=False, regex=False)
         ]
 
         if handshakes.empty or len(handshakes) == 0:
@@ -837,11 +1014,7 @@ class PostFiatTaskManager:
         df = pd.DataFrame(results)
         contacts = self.credential_manager.get_contacts()
         df['contact_name'] = df['address'].map(contacts)
-        df['display_address'] = df.apply(
-            lambda x: x['contact_name'] + ' (' + x['address'] + ')' 
-                if pd.notna(x['contact_name']) else x['address'],
-            axis=1
-        )
+        df['display_address'] = self._format_display_addresses(df['address'], df['contact_name'])
 
         return df
 
@@ -863,7 +1036,7 @@ class PostFiatTaskManager:
         
         # Filter for handshakes
         handshakes = self.system_memos[
-            self.system_memos['task_id'].str.contains(SystemMemoType.HANDSHAKE.value, na=False)
+            self.system_memos['task_id'].str.contains(SystemMemoType.HANDSHAKE.value, na=False, regex=False)
         ]
 
         if handshakes.empty or len(handshakes) == 0:
@@ -886,8 +1059,7 @@ class PostFiatTaskManager:
         received_key = None
         if not received_handshakes.empty and len(received_handshakes) > 0:
             logger.debug(f"Found {len(received_handshakes)} received handshakes from {address}")
-            latest_received_handshake = received_handshakes.sort_values('datetime').iloc[-1]
-            received_key = latest_received_handshake['full_output']
+            received_key = received_handshakes.at[received_handshakes['datetime'].iloc[::-1].idxmax(), 'full_output']
             logger.debug(f"Most recent received handshake: {received_key[:8]}...")
 
         result = (handshake_sent, received_key)
@@ -977,31 +1149,33 @@ class PostFiatTaskManager:
 
         # Calculate chunks needed and validate size
         num_chunks = PostFiatTaskManager.calculate_required_chunks(memo, max_size)
-        chunk_size = len(memo_data.encode('utf-8')) // num_chunks
+        data_bytes = memo_data.encode('utf-8')
+        chunk_size = len(data_bytes) // num_chunks
+
+        # Hex sizes of the fields shared by every chunk, for the debug output below
+        hex_format_size = len(memo_format.encode('utf-8')) * 2
+        hex_type_size = len(memo_type.encode('utf-8')) * 2
                 
-        # Split into chunks
+        # Split into chunks, decoding straight from views of the encoded data instead of copied slices
         chunked_memos = []
-        data_bytes = memo_data.encode('utf-8')
+        data_view = memoryview(data_bytes)
         for chunk_number in range(1, num_chunks + 1):
             start_idx = (chunk_number - 1) * chunk_size
             end_idx = start_idx + chunk_size if chunk_number < num_chunks else len(data_bytes)
-            chunk = data_bytes[start_idx:end_idx]
-            chunk_with_label = f"chunk_{chunk_number}__{chunk.decode('utf-8', errors='ignore')}"
+            chunk = str(data_view[start_idx:end_idx], 'utf-8', 'ignore')
+            chunk_with_label = f"chunk_{chunk_number}__{chunk}"
+            hex_data_size = len(chunk_with_label.encode('utf-8')) * 2
 
             # Debug the sizes
-            test_format = str_to_hex(memo_format)
-            test_type = str_to_hex(memo_type)
-            test_data = str_to_hex(chunk_with_label)
-            
             logger.debug(f"Chunk {chunk_number} sizes:")
             logger.debug(f"  Plaintext Format size: {len(memo_format)}")
             logger.debug(f"  Plaintext Type size: {len(memo_type)}")
             logger.debug(f"  Plaintext Data size: {len(chunk_with_label)}")
             logger.debug(f"  Plaintext Total size: {len(memo_format) + len(memo_type) + len(chunk_with_label)}")
-            logger.debug(f"  Hex Format size: {len(test_format)}")
-            logger.debug(f"  Hex Type size: {len(test_type)}")
-            logger.debug(f"  Hex Data size: {len(test_data)}")
-            logger.debug(f"  Hex Total size: {len(test_format) + len(test_type) + len(test_data)}")
+            logger.debug(f"  Hex Format size: {hex_format_size}")
+            logger.debug(f"  Hex Type size: {hex_type_size}")
+            logger.debug(f"  Hex Data size: {hex_data_size}")
+            logger.debug(f"  Hex Total size: {hex_format_size + hex_type_size + hex_data_size}")
             
             chunk_memo = construct_memo(
                 memo_format=memo_format,
@@ -1129,13 +1303,13 @@ class PostFiatTaskManager:
         if chunk:
             try:
                 chunk_memos = self._chunk_memos(memo)
-                responses = []
+                payments = []
 
                 for idx, chunk_memo in enumerate(chunk_memos):
-                    logger.debug(f"Sending chunk {idx+1} of {len(chunk_memos)}: {chunk_memo.memo_data[:100]}...")
-                    responses.append(self._send_memo_single(destination, chunk_memo, pft_amount))
+                    logger.debug(f"Preparing chunk {idx+1} of {len(chunk_memos)}: {chunk_memo.memo_data[:100]}...")
+                    payments.append(self._build_memo_payment(destination, chunk_memo, pft_amount))
 
-                return responses
+                return self._submit_chunk_payments(payments)
             except Exception as e:
                 logger.error(f"Error chunking memo: {e}")
                 logger.error(f"traceback: {traceback.format_exc()}")
@@ -1145,7 +1319,23 @@ class PostFiatTaskManager:
     
     def _send_memo_single(self, destination: str, memo: Memo, pft_amount: Decimal):
         """ Sends a memo to a destination. """
-        client = xrpl.clients.JsonRpcClient(self.network_url)
+        payment = self._build_memo_payment(destination, memo, pft_amount)
+
+        try:
+            logger.debug("Submitting and waiting for transaction")
+            response = run_coroutine(xrpl.asyncio.transaction.submit_and_wait(payment, self.client, self.user_wallet))    
+        except xrpl.transaction.XRPLReliableSubmissionException as e:
+            response = f"Transaction submission failed: {e}"
+            logger.error(response)
+        except Exception as e:
+            response = f"Unexpected error: {e}"
+            logger.error(response)
+            logger.error(traceback.format_exc())
+
+        return response
+
+    def _build_memo_payment(self, destination: str, memo: Memo, pft_amount: Decimal):
+        """ Builds an unsigned memo payment, carrying PFT if pft_amount is positive and minimum XRP otherwise """
 
         payment_args = {
             "account": self.user_wallet.address,
@@ -1163,20 +1353,7 @@ class PostFiatTaskManager:
             # Send minimum XRP amount for memo-only transactions
             payment_args["amount"] = xrpl.utils.xrp_to_drops(Decimal(constants.MIN_XRP_PER_TRANSACTION))
 
-        payment = xrpl.models.transactions.Payment(**payment_args)
-
-        try:
-            logger.debug("Submitting and waiting for transaction")
-            response = xrpl.transaction.submit_and_wait(payment, client, self.user_wallet)    
-        except xrpl.transaction.XRPLReliableSubmissionException as e:
-            response = f"Transaction submission failed: {e}"
-            logger.error(response)
-        except Exception as e:
-            response = f"Unexpected error: {e}"
-            logger.error(response)
-            logger.error(traceback.format_exc())
-
-        return response
+        return xrpl.models.transactions.Payment(**payment_args)
 
     def _reconstruct_chunked_message(
         self,
@@ -1194,22 +1371,18 @@ class PostFiatTaskManager:
         """
         try: 
 
-            # Get all chunks with this memo type
-            memo_chunks = memos[
-                (memos['task_id'] == memo_type) &
-                (memos['full_output'].str.match(r'^chunk_\d+__'))  # Only get actual chunks
-            ].copy()
-
-            if memo_chunks.empty:
+            # Get all chunks with this memo type, parsing the chunk number in the same pass that identifies actual chunks
+            memo_chunks = memos[memos['task_id'] == memo_type]
+            chunk_numbers = memo_chunks['full_output'].str.extract(CHUNK_PREFIX_PATTERN, expand=False)
+            is_chunk = chunk_numbers.notna()
+            if not is_chunk.any():
                 return None
 
-            # Extract chunk numbers and sort
-            def extract_chunk_number(x):
-                match = re.search(r'chunk_(\d+)__', x)
-                return int(match.group(1)) if match else 0
-            
-            memo_chunks['chunk_number'] = memo_chunks['full_output'].apply(extract_chunk_number)
-            memo_chunks.sort_values(by='datetime', ascending=True, inplace=True)
+            memo_chunks = (
+                memo_chunks[is_chunk]
+                .assign(chunk_number=chunk_numbers[is_chunk].astype(int))
+                .sort_values(by='datetime', ascending=True)
+            )
 
             # Detect and handle multiple chunk sequences
             current_sequence = []
@@ -1375,9 +1548,21 @@ class PostFiatTaskManager:
                                 ledger_index_max=-1, 
                                 limit=10
                                 ):
+        """ Returns all transactions for an account in the ledger range as a single list """
+        return [
+            tx
+            for page in self.iter_account_transaction_pages(account_address, ledger_index_min, ledger_index_max, limit)
+            for tx in page
+        ]
+
+    def iter_account_transaction_pages(self, account_address='r3UHe45BzAVB3ENd21X9LeQngr4ofRJo5n', 
+                                ledger_index_min=-1, 
+                                ledger_index_max=-1, 
+                                limit=10
+                                ):
+        """ Yields pages of transactions for an account in ascending order, following the AccountTx marker.
+        The request for the next page is already in flight while the caller processes the current one."""
         logger.debug(f"Getting transactions for account {account_address} with ledger index min {ledger_index_min} and max {ledger_index_max} and limit {limit}")
-        client = xrpl.clients.JsonRpcClient(self.network_url)
-        all_transactions = []
         marker = None
         previous_marker = None
         max_iterations = 1000
@@ -1389,12 +1574,8 @@ class PostFiatTaskManager:
         if isinstance(ledger_index_max, np.int64):
             ledger_index_max = int(ledger_index_max)
 
-        while iteration_count < max_iterations:
-            iteration_count += 1
-            logger.debug(f"Iteration {iteration_count}")
-            print(f"current marker: {marker}")
-
-            request = AccountTx(
+        def build_request(marker):
+            return AccountTx(
                 account=account_address,
                 ledger_index_min=ledger_index_min, # Use -1 for the earliest ledger index
                 ledger_index_max=ledger_index_max, # Use -1 for the latest ledger index
@@ -1403,51 +1584,61 @@ class PostFiatTaskManager:
                 forward=True # Set to True to return results in ascending order 
             )
 
-            try:
-                # Convert the request to a dict and then to a JSON to check for serialization
-                request_dict = request.to_dict()
-                json.dumps(request_dict)  # This will raise an error if the request is not serializable
-            except TypeError as e:
-                logger.error(f"Request is not serializable: {e}")
-                logger.error(f"Problematic request data: {request_dict}")
-                break # stop if request is not serializable
-
-            try:
-                response = client.request(request)
-                
-                # debugging
-                # logger.debug(f"Full XRPL response: {response}")
-
-                if response.is_successful():
-                    transactions = response.result.get("transactions", [])
-                    logger.debug(f"Retrieved {len(transactions)} transactions")
-
+        # Check serialization once; later pages only swap in the marker returned by the server
+        request = build_request(marker)
+        try:
+            # Convert the request to a dict and then to a JSON to check for serialization
+            request_dict = request.to_dict()
+            json.dumps(request_dict)  # This will raise an error if the request is not serializable
+        except TypeError as e:
+            logger.error(f"Request is not serializable: {e}")
+            logger.error(f"Problematic request data: {request_dict}")
+            return # stop if request is not serializable
+
+        event_loop_thread = get_event_loop_thread()
+        pending = event_loop_thread.submit(self.client.request(request))
+        try:
+            while pending is not None and iteration_count < max_iterations:
+                iteration_count += 1
+                logger.debug(f"Iteration {iteration_count}, current marker: {marker}")
+
+                try:
+                    response = pending.result()
+                    pending = None
+                    
                     # debugging
-                    logger.debug(f"Full websocket transaction message: {transactions}")
+                    # logger.debug(f"Full XRPL response: {response}")
 
-                    all_transactions.extend(transactions)
-                else:
-                    logger.error(f"Error in XRPL response: {response}")
+                    if response.is_successful():
+                        transactions = response.result.get("transactions", [])
+                        logger.debug(f"Retrieved {len(transactions)} transactions")
+                    else:
+                        logger.error(f"Error in XRPL response: {response}")
+                        break
+                except Exception as e:
+                    logger.error(f"Error making XRPL request: {e}")
                     break
-            except Exception as e:
-                logger.error(f"Error making XRPL request: {e}")
-                break
 
-            if "marker" in response.result:
-                if response.result["marker"] == previous_marker:
-                    logger.warning("Marker not advancing, stopping iteration")
-                    break # stop if marker not advancing
-                previous_marker = marker
-                marker = response.result["marker"] # Update marker for next iteration
-                logger.debug("More transactions available. Fetching next batch...")
-            else:
-                logger.debug("No more transactions available")
-                break
+                if "marker" in response.result:
+                    if response.result["marker"] == previous_marker:
+                        logger.warning("Marker not advancing, stopping iteration")
+                    else:
+                        previous_marker = marker
+                        marker = response.result["marker"] # Update marker for next iteration
+                        logger.debug("More transactions available. Fetching next batch...")
+                        if iteration_count < max_iterations:
+                            pending = event_loop_thread.submit(self.client.request(build_request(marker)))
+                else:
+                    logger.debug("No more transactions available")
+
+                yield transactions
+        finally:
+            # The caller may stop early, leaving a prefetched page nobody will read
+            if pending is not None:
+                pending.cancel()
         
         if iteration_count == max_iterations:
             logger.warning("Reached maximum iteration count. Stopping loop...")
-
-        return all_transactions
     
     # TODO: Attempt to apply DRY principle with get_account_transactions
     def get_account_transactions__exhaustive(self,account_address='r3UHe45BzAVB3ENd21X9LeQngr4ofRJo5n',
@@ -1455,8 +1646,20 @@ class PostFiatTaskManager:
                                 ledger_index_max=-1,
                                 max_attempts=3,
                                 retry_delay=.2):
+        return run_coroutine(self._get_account_transactions__exhaustive_async(
+            account_address=account_address,
+            ledger_index_min=ledger_index_min,
+            ledger_index_max=ledger_index_max,
+            max_attempts=max_attempts,
+            retry_delay=retry_delay
+        ))
+
+    async def _get_account_transactions__exhaustive_async(self, account_address,
+                                ledger_index_min=-1,
+                                ledger_index_max=-1,
+                                max_attempts=3,
+                                retry_delay=.2):
 
-        client = xrpl.clients.JsonRpcClient(self.network_url)  # Using a public server; adjust as necessary
         all_transactions = []  # List to store all transactions
 
         # Fetch transactions using marker pagination
@@ -1472,7 +1675,7 @@ class PostFiatTaskManager:
                     marker=marker,
                     forward=True
                 )
-                response = client.request(request)
+                response = await self.client.request(request)
                 transactions = response.result["transactions"]
                 all_transactions.extend(transactions)
 
@@ -1485,7 +1688,7 @@ class PostFiatTaskManager:
                 attempt += 1
                 if attempt < max_attempts:
                     print(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
                 else:
                     print("Max attempts reached. Transactions may be incomplete.")
                     break
@@ -1498,30 +1701,34 @@ class PostFiatTaskManager:
                                 ledger_index_max=-1,
                                 max_attempts=3,
                                 retry_delay=.2,
-                                num_runs=5):
-        
+                                num_runs=5,
+                                max_concurrent_runs=2):
+        
+        logger.debug(f"Starting {num_runs} runs, at most {max_concurrent_runs} at a time")
+
+        # The runs are independent, so a few can overlap, but each crawls the full history so they are capped to spare the node
+        async def run_all():
+            semaphore = asyncio.Semaphore(max_concurrent_runs)
+
+            async def run_once():
+                async with semaphore:
+                    return await self._get_account_transactions__exhaustive_async(
+                        account_address=account_address,
+                        ledger_index_min=ledger_index_min,
+                        ledger_index_max=ledger_index_max,
+                        max_attempts=max_attempts,
+                        retry_delay=retry_delay
+                    )
+
+            return await asyncio.gather(*(run_once() for _ in range(num_runs)))
+
         longest_transactions = []
-        
-        for i in range(num_runs):
-            print(f"Run {i+1}/{num_runs}")
-            
-            transactions = self.get_account_transactions__exhaustive(
-                account_address=account_address,
-                ledger_index_min=ledger_index_min,
-                ledger_index_max=ledger_index_max,
-                max_attempts=max_attempts,
-                retry_delay=retry_delay
-            )
-            
+        for i, transactions in enumerate(run_coroutine(run_all())):
             num_transactions = len(transactions)
-            print(f"Number of transactions: {num_transactions}")
+            print(f"Run {i+1}/{num_runs} number of transactions: {num_transactions}")
             
             if num_transactions > len(longest_transactions):
                 longest_transactions = transactions
-            
-            if i < num_runs - 1:
-                print(f"Waiting for {retry_delay} seconds before the next run...")
-                time.sleep(retry_delay)
         
         print(f"Longest list of transactions: {len(longest_transactions)} transactions")
         return longest_transactions
@@ -1534,21 +1741,20 @@ class PostFiatTaskManager:
             logger.warning("System memos dataframe is empty. No context doc link found.")
             return None
 
-        # Filter for outgoing google doc context links
-        redux_tx_list = self.system_memos[
-            (self.system_memos['task_id'] == SystemMemoType.GOOGLE_DOC_CONTEXT_LINK.value) &
-            (self.system_memos['direction'] == 'OUTGOING')
-        ]
-        
-        logger.debug(f"Found {len(redux_tx_list)} outgoing context doc links")
-        
-        if len(redux_tx_list) == 0:
+        # System memos are appended in ledger order, so scan backwards and stop at the most recent outgoing context link
+        memo_data = None
+        for task_id, direction, full_output in zip(
+            self.system_memos['task_id'].to_numpy()[::-1],
+            self.system_memos['direction'].to_numpy()[::-1],
+            self.system_memos['full_output'].to_numpy()[::-1]
+        ):
+            if task_id == SystemMemoType.GOOGLE_DOC_CONTEXT_LINK.value and direction == 'OUTGOING':
+                memo_data = full_output
+                break
+
+        if memo_data is None:
             logger.warning("No Google Doc context link found")
             return None
-        
-        # Get the most recent google doc context link
-        most_recent_context_link = redux_tx_list.sort_values('datetime', ascending=False).iloc[0]
-        memo_data = most_recent_context_link['full_output']
 
         logger.debug(f"Most recent google doc link: {memo_data}")
 
@@ -1568,23 +1774,24 @@ class PostFiatTaskManager:
     def output_account_address_node_association(self):
         """this takes the account info frame and figures out what nodes
          the account is associating with and returns them in a dataframe """
-        self.memo_transactions['valid_task_id']=self.memo_transactions['memo_data'].apply(is_valid_id)
+        self.memo_transactions['valid_task_id'] = [is_valid_id(memo_data) for memo_data in self.memo_transactions['memo_data'].to_numpy()]
         node_output_df = self.memo_transactions[self.memo_transactions['direction']=='INCOMING'][['valid_task_id','account']].groupby('account').sum()
    
         return node_output_df[node_output_df['valid_task_id']>0]
     
-    def get_user_initiation_rites_destinations(self):
-        """Returns all the addresses that have received a user initiation rite"""
-        all_user_initiation_rites = self.memo_transactions[
-            self.memo_transactions['memo_data'].apply(lambda x: x.get('task_id') == SystemMemoType.INITIATION_RITE.value)
-        ]
-        return list(all_user_initiation_rites['destination'])
+    def get_user_initiation_rites_destinations(self) -> set:
+        """Returns the set of addresses that have received a user initiation rite"""
+        return {
+            destination
+            for destination, task_id in zip(self.memo_transactions['destination'].to_numpy(), self.memo_transactions['task_id'].to_numpy())
+            if task_id == SystemMemoType.INITIATION_RITE.value
+        }
     
     def initiation_rite_sent(self):
         logger.debug("Checking if user has sent initiation rite...")
 
         # Check if memos dataframe is empty or missing required columns
-        if self.memo_transactions.empty or not all(col in self.memo_transactions.columns for col in ['destination', 'memo_data']):
+        if self.memo_transactions.empty or not all(col in self.memo_transactions.columns for col in ['destination', 'task_id']):
             logger.debug("Memos dataframe is empty or missing required columns, returning False")
             return False
 
@@ -1649,61 +1856,52 @@ class PostFiatTaskManager:
         if self.tasks.empty:
             return pd.DataFrame()
 
-        # Filter tasks with task_type in ['PROPOSAL','ACCEPTANCE']
-        filtered_tasks = self.tasks[self.tasks['task_type'].isin([
-            TaskType.PROPOSAL.name, 
-            TaskType.ACCEPTANCE.name,
-            TaskType.REFUSAL.name
-        ])]
-
         # Get task_ids where:
         # 1. The latest state is 'PROPOSAL' or 'ACCEPTANCE' (or REFUSAL if include_refused=True) AND
         # 2. if include_refused=False, exclude tasks that have ever been refused
-        proposal_task_ids = []
         valid_states = [TaskType.PROPOSAL.name, TaskType.ACCEPTANCE.name]
         if include_refused:
             valid_states.append(TaskType.REFUSAL.name)
 
-        for task_id in filtered_tasks['task_id'].unique():
-            task_df = self.get_task(task_id)
-            latest_state = self.get_task_state(task_df)
-            
-            if latest_state in valid_states:
-                if include_refused or TaskType.REFUSAL.name not in task_df['task_type'].values:
-                    proposal_task_ids.append(task_id)
+        latest_task_states = self.get_latest_task_states()
+        proposal_task_ids = set(latest_task_states.index[latest_task_states.isin(valid_states)])
+        if not include_refused:
+            proposal_task_ids -= set(self.tasks.loc[self.tasks['task_type'] == TaskType.REFUSAL.name, 'task_id'])
 
         # Filter for these tasks
-        filtered_df = self.tasks[(self.tasks['task_id'].isin(proposal_task_ids))].copy()
+        filtered_df = self.tasks[(self.tasks['task_id'].isin(list(proposal_task_ids)))]
 
         if filtered_df.empty:
             return pd.DataFrame()
 
         # Create new 'RESPONSE' column to combine acceptance and refusal
-        filtered_df['response_type'] = filtered_df['task_type'].apply(
-            lambda x: 'RESPONSE' if x in [TaskType.ACCEPTANCE.name, TaskType.REFUSAL.name] else x
-        )
+        filtered_df = filtered_df.assign(response_type=np.where(
+            filtered_df['task_type'].isin([TaskType.ACCEPTANCE.name, TaskType.REFUSAL.name]),
+            'RESPONSE',
+            filtered_df['task_type'].astype(str)
+        ))
 
         # Pivot the dataframe to get proposals and responses side by side and reset index to make task_id a column
-        pivoted_df = filtered_df.pivot_table(index='task_id', columns='response_type', values='full_output', aggfunc='first').reset_index().copy()
+        pivoted_df = filtered_df.pivot_table(index='task_id', columns='response_type', values='full_output', aggfunc='first').reset_index()
 
         # Rename the columns for clarity
         pivoted_df.rename(columns={'REQUEST_POST_FIAT':'request', 'PROPOSAL':'proposal', 'RESPONSE':'response'}, inplace=True)
 
         # Clean up the proposal column
-        pivoted_df['proposal'] = pivoted_df['proposal'].apply(lambda x: str(x).replace(TaskType.PROPOSAL.value,'').replace('nan',''))
+        pivoted_df['proposal'] = pivoted_df['proposal'].fillna('').str.replace(TaskType.PROPOSAL.value, '', regex=False)
 
         # Clean up the request column
-        pivoted_df['request'] = pivoted_df['request'].apply(lambda x: str(x).replace(TaskType.REQUEST_POST_FIAT.value,'').replace('nan',''))
+        pivoted_df['request'] = pivoted_df['request'].fillna('').str.replace(TaskType.REQUEST_POST_FIAT.value, '', regex=False)
         
         # Clean up the response column, if it exists (does not exist for the first proposal)
         if 'response' in pivoted_df.columns:
-            pivoted_df['response'] = pivoted_df['response'].apply(lambda x: str(x).replace(TaskType.ACCEPTANCE.value,'ACCEPTED: ').replace('nan',''))
-            pivoted_df['response'] = pivoted_df['response'].apply(lambda x: str(x).replace(TaskType.REFUSAL.value,'REFUSED: ').replace('nan',''))
+            pivoted_df['response'] = pivoted_df['response'].fillna('').str.replace(TaskType.ACCEPTANCE.value, 'ACCEPTED: ', regex=False)
+            pivoted_df['response'] = pivoted_df['response'].str.replace(TaskType.REFUSAL.value, 'REFUSED: ', regex=False)
         else:
             pivoted_df['response'] = ''
         
         # Reverse order to get the most recent proposals first
-        result_df = pivoted_df.iloc[::-1].reset_index(drop=True).copy()
+        result_df = pivoted_df.iloc[::-1].reset_index(drop=True)
 
         return result_df
     
@@ -1715,33 +1913,28 @@ class PostFiatTaskManager:
         if self.tasks.empty:
             return pd.DataFrame()
 
-        # Filter tasks with task_type in ['PROPOSAL','VERIFICATION_PROMPT']
-        filtered_tasks = self.tasks[self.tasks['task_type'].isin([TaskType.PROPOSAL.name, TaskType.VERIFICATION_PROMPT.name])]
-
         # Get task_ids where the latest state is 'VERIFICATION_PROMPT'
-        verification_task_ids = [
-            task_id for task_id in filtered_tasks['task_id'].unique()
-            if self.get_task_state_using_task_id(task_id) == TaskType.VERIFICATION_PROMPT.name
-        ]
+        latest_task_states = self.get_latest_task_states()
+        verification_task_ids = latest_task_states.index[latest_task_states == TaskType.VERIFICATION_PROMPT.name]
 
         # Filter for these tasks
-        filtered_df = self.tasks[(self.tasks['task_id'].isin(verification_task_ids))].copy()
+        filtered_df = self.tasks[(self.tasks['task_id'].isin(verification_task_ids))]
 
         if filtered_df.empty:
             return pd.DataFrame()
 
         # Pivot the dataframe to get proposals and verification prompts side by side and reset index to make task_id a column
-        pivoted_df = filtered_df.pivot_table(index='task_id', columns='task_type', values='full_output', aggfunc='first').reset_index().copy()
+        pivoted_df = filtered_df.pivot_table(index='task_id', columns='task_type', values='full_output', aggfunc='first', observed=True).reset_index()
 
         # Rename columns for clarity
         pivoted_df.rename(columns={'PROPOSAL':'proposal', 'VERIFICATION_PROMPT':'verification'}, inplace=True)
 
         # clean up the proposal and verification columns
-        pivoted_df['proposal'] = pivoted_df['proposal'].apply(lambda x: str(x).replace(TaskType.PROPOSAL.value,''))
-        pivoted_df['verification'] = pivoted_df['verification'].apply(lambda x: str(x).replace(TaskType.VERIFICATION_PROMPT.value,''))
+        pivoted_df['proposal'] = pivoted_df['proposal'].fillna('').str.replace(TaskType.PROPOSAL.value, '', regex=False)
+        pivoted_df['verification'] = pivoted_df['verification'].fillna('').str.replace(TaskType.VERIFICATION_PROMPT.value, '', regex=False)
 
         # Reverse order to get the most recent proposals first
-        result_df = pivoted_df.iloc[::-1].reset_index(drop=True).copy()
+        result_df = pivoted_df.iloc[::-1].reset_index(drop=True)
 
         return result_df
     
@@ -1753,48 +1946,45 @@ class PostFiatTaskManager:
         if self.tasks.empty:
             return pd.DataFrame()
 
-        # Filter for only PROPOSAL and REWARD rows
-        filtered_df = self.tasks[self.tasks['task_type'].isin([TaskType.PROPOSAL.name, TaskType.REWARD.name])]
-
         # Get task_ids where the latest state is 'REWARD'
-        reward_task_ids = [
-            task_id for task_id in filtered_df['task_id'].unique()
-            if self.get_task_state_using_task_id(task_id) == TaskType.REWARD.name
-        ]
+        latest_task_states = self.get_latest_task_states()
+        reward_task_ids = latest_task_states.index[latest_task_states == TaskType.REWARD.name]
 
         # Filter for these tasks
-        filtered_df = self.tasks[(self.tasks['task_id'].isin(reward_task_ids))].copy()
+        filtered_df = self.tasks[(self.tasks['task_id'].isin(reward_task_ids))]
 
         if filtered_df.empty:
             return pd.DataFrame()
 
         # Pivot the dataframe to get proposals and rewards side by side and reset index to make task_id a column
-        pivoted_df = filtered_df.pivot_table(index='task_id', columns='task_type', values='full_output', aggfunc='first').reset_index().copy()
+        pivoted_df = filtered_df.pivot_table(index='task_id', columns='task_type', values='full_output', aggfunc='first', observed=True).reset_index()
 
         # Rename the columns for clarity # TODO: this seems pointless
         pivoted_df.rename(columns={'PROPOSAL':'proposal', 'REWARD':'reward'}, inplace=True)
 
         # Clean up the proposal and reward columns
-        pivoted_df['reward'] = pivoted_df['reward'].apply(lambda x: str(x).replace(TaskType.REWARD.value,''))
-        pivoted_df['proposal'] = pivoted_df['proposal'].apply(lambda x: str(x).replace(TaskType.PROPOSAL.value,'').replace('nan',''))
+        pivoted_df['reward'] = pivoted_df['reward'].fillna('').str.replace(TaskType.REWARD.value, '', regex=False)
+        pivoted_df['proposal'] = pivoted_df['proposal'].fillna('').str.replace(TaskType.PROPOSAL.value, '', regex=False)
 
         # Reverse order to get the most recent proposals first
-        result_df = pivoted_df.iloc[::-1].reset_index(drop=True).copy()
+        result_df = pivoted_df.iloc[::-1].reset_index(drop=True)
+
+        # Add PFT value information in a single pass over the PFT memos, reusing the is_pft flag computed when the memos were synced.
+        # Later reward payments for the same task overwrite earlier ones
+        pft_only = self.memo_transactions[self.memo_transactions['is_pft']]
+        task_id_to_payout = {}
+        for tx_json, direction, task_id, full_output in zip(
+            pft_only['tx_json'].to_numpy(), pft_only['direction'].to_numpy(),
+            pft_only['task_id'].to_numpy(), pft_only['full_output'].to_numpy()
+        ):
+            if TaskType.REWARD.value in full_output:
+                pft_value = float(tx_json['DeliverMax']['value'])
+                task_id_to_payout[task_id] = pft_value if direction == 'INCOMING' else -pft_value
 
-        # Add PFT value information
-        pft_only = self.memo_transactions[self.memo_transactions['tx_json'].apply(is_pft_transaction)].copy()
-        pft_only['pft_value'] = pft_only['tx_json'].apply(
-            lambda x: x['DeliverMax']['value']).astype(float) * pft_only['direction'].map({'INCOMING':1,'OUTGOING':-1}
-        )
-        pft_only['task_id'] = pft_only['memo_data'].apply(lambda x: x['task_id'])
-        
-        pft_rewards_only = pft_only[pft_only['memo_data'].apply(lambda x: TaskType.REWARD.value in x['full_output'])].copy()
-        task_id_to_payout = pft_rewards_only.groupby('task_id').last()['pft_value']
-        
         result_df['payout'] = result_df['task_id'].map(task_id_to_payout)
 
         # Remove rows where payout is NaN
-        result_df = result_df[result_df['payout'].notna()].reset_index(drop=True).copy()
+        result_df = result_df[result_df['payout'].notna()].reset_index(drop=True)
 
         return result_df
     
@@ -1805,34 +1995,26 @@ class PostFiatTaskManager:
         if self.memo_transactions.empty:
             return pd.DataFrame()
         
-        df = self.memo_transactions.copy()
+        # Only copy the columns needed here, not the full tx_json/memo_data payloads
+        df = self.memo_transactions[['meta', 'direction', 'counterparty_address', 'hash', 'datetime']].copy()
 
-        # Extract delivered amoutn and determine token type
-        def get_payment_details(row):
-            meta = row['meta']  # meta is already deserialized in memory
-            delivered = meta.get('delivered_amount', None)
+        # Extract delivered amount and determine token type
+        def get_payment_details(meta):
+            delivered = meta.get('delivered_amount', None)  # meta is already deserialized in memory
 
             if isinstance(delivered, dict):  # PFT payment
                 # Convert to float and format to prevent scientific notation
                 amount = float(delivered['value'])
                 amount_str = f"{amount:f}".rstrip('0').rstrip('.')  # Remove trailing zeros and decimal point if whole number
-                return {
-                    'amount': amount_str,
-                    'token': delivered['currency']
-                }
-            elif delivered:  # XRP payment
-                amount = float(delivered) / 1000000
-                amount_str = f"{amount:f}".rstrip('0').rstrip('.') 
-                return {
-                    'amount': amount_str,
-                    'token': 'XRP'
-                }
-            return {'amount': None, 'token': None}
-
-        # Extract payment details
-        payment_details = df.apply(get_payment_details, axis=1)
-        df['amount'] = payment_details.apply(lambda x: x['amount'])
-        df['token'] = payment_details.apply(lambda x: x['token'])
+                return amount_str, delivered['currency']
+            elif delivered:  # XRP payment, delivered as an integer string of drops
+                xrp, drops = divmod(int(delivered), 1000000)
+                amount_str = f"{xrp}.{drops:06d}".rstrip('0').rstrip('.')
+                return amount_str, 'XRP'
+            return None, None
+
+        # Extract payment details in a single pass over the meta column
+        df['amount'], df['token'] = zip(*df['meta'].map(get_payment_details))
 
         # Replace direction with to/from
         df['direction'] = df['direction'].map({'INCOMING': 'From', 'OUTGOING': 'To'})
@@ -1840,11 +2022,7 @@ class PostFiatTaskManager:
         # Add contact names where available
         contacts = self.credential_manager.get_contacts()
         df['contact_name'] = df['counterparty_address'].map(contacts)
-        df['display_address'] = df.apply(
-            lambda x: x['contact_name'] + ' (' + x['counterparty_address'] + ')' 
-                if pd.notna(x['contact_name']) else x['counterparty_address'],
-            axis=1
-        )
+        df['display_address'] = self._format_display_addresses(df['counterparty_address'], df['contact_name'])
 
         df['tx_hash'] = df['hash']
 
@@ -1866,26 +2044,28 @@ class PostFiatTaskManager:
 
         # Filter for only MEMO type messages 
         memo_history = self.memos[
-            self.memos['full_output'].str.contains(MessageType.MEMO.value, na=False)
-        ].copy()
+            self.memos['full_output'].str.contains(MessageType.MEMO.value, na=False, regex=False)
+        ]
 
         if memo_history.empty:
             logger.debug("No memos found")
             return pd.DataFrame()
         
+        # Only the first transaction of each message is needed, so take them all in one pass instead of masking per message
+        first_txns = memo_history.drop_duplicates(subset='task_id')
+
         processed_messages = []
-        for msg_id in memo_history['task_id'].unique():
-            msg_txns = memo_history[memo_history['task_id'] == msg_id]
-            first_txn = msg_txns.iloc[0]
+        for first_txn in first_txns.itertuples(index=False):
+            msg_id = first_txn.task_id
 
             try:
                 # process the message (chunking, compression, encryption)
                 processed_message = self.process_memo_data(
                     memo_type=msg_id,
-                    memo_data=first_txn['full_output'],
+                    memo_data=first_txn.full_output,
                     full_unchunk=True,
                     memo_history=memo_history,
-                    channel_counterparty=first_txn['counterparty_address']
+                    channel_counterparty=first_txn.counterparty_address
                 )
             except Exception as e:
                 logger.error(f"Error processing message {msg_id}: {e}")
@@ -1894,9 +2074,9 @@ class PostFiatTaskManager:
             processed_messages.append({
                 'memo_id': msg_id,
                 'memo': processed_message,
-                'direction': 'From' if first_txn['direction'] == 'INCOMING' else 'To',
-                'counterparty_address': first_txn['counterparty_address'],
-                'datetime': first_txn['datetime']
+                'direction': 'From' if first_txn.direction == 'INCOMING' else 'To',
+                'counterparty_address': first_txn.counterparty_address,
+                'datetime': first_txn.datetime
             })
 
         # Create DataFrame and sort by datetime
@@ -1906,11 +2086,7 @@ class PostFiatTaskManager:
         # Add contact names where available
         contacts = self.credential_manager.get_contacts()
         result['contact_name'] = result['counterparty_address'].map(contacts)
-        result['display_address'] = result.apply(
-            lambda x: f"{x['contact_name']} ({x['counterparty_address']})" 
-                if pd.notna(x['contact_name']) else x['counterparty_address'],
-            axis=1
-        )
+        result['display_address'] = self._format_display_addresses(result['counterparty_address'], result['contact_name'])
 
         return result[['memo_id', 'memo', 'direction', 'display_address']]
 
@@ -1923,7 +2099,7 @@ class PostFiatTaskManager:
         if most_recent_status != TaskType.PROPOSAL.name:
             raise WrongTaskStateException(TaskType.PROPOSAL.name, most_recent_status)
 
-        proposal_source = task_df.iloc[0]['counterparty_address']
+        proposal_source = task_df['counterparty_address'].iat[0]
         if TaskType.ACCEPTANCE.value not in acceptance_string:
             classified_string=TaskType.ACCEPTANCE.value + acceptance_string
         else:
@@ -1945,7 +2121,7 @@ class PostFiatTaskManager:
         if most_recent_status == TaskType.REWARD.name:
             raise WrongTaskStateException(TaskType.REWARD.name, most_recent_status, restricted_flag=True)
         
-        proposal_source = task_df.iloc[0]['counterparty_address']
+        proposal_source = task_df['counterparty_address'].iat[0]
         if TaskType.REFUSAL.value not in refusal_reason:
             refusal_reason = TaskType.REFUSAL.value + refusal_reason
         constructed_memo = construct_basic_postfiat_memo(user=self.credential_manager.postfiat_username, 
@@ -1973,8 +2149,7 @@ class PostFiatTaskManager:
         while True:
             task_id = self.generate_custom_id()
             try:
-                task_df = self.tasks[self.tasks['task_id'] == task_id]
-                if task_df.empty:
+                if task_id not in self._get_task_index():
                     break
                 logger.debug(f"Task ID {task_id} already exists, generating new ID")
             except Exception as e:
@@ -2010,7 +2185,7 @@ class PostFiatTaskManager:
         if most_recent_status != TaskType.ACCEPTANCE.name:
             raise WrongTaskStateException(TaskType.ACCEPTANCE.name, most_recent_status)
         
-        proposal_source = task_df.iloc[0]['counterparty_address']
+        proposal_source = task_df['counterparty_address'].iat[0]
         if TaskType.TASK_OUTPUT.value not in completion_string:
             classified_completion_str = TaskType.TASK_OUTPUT.value + completion_string
         else:
@@ -2039,7 +2214,7 @@ class PostFiatTaskManager:
         if most_recent_status != TaskType.VERIFICATION_PROMPT.name:
             raise WrongTaskStateException(TaskType.VERIFICATION_PROMPT.name, most_recent_status)
         
-        proposal_source = task_df.iloc[0]['counterparty_address']
+        proposal_source = task_df['counterparty_address'].iat[0]
         if TaskType.VERIFICATION_RESPONSE.value not in response_string:
             classified_response_str = TaskType.VERIFICATION_RESPONSE.value + response_string
         else:
@@ -2054,12 +2229,12 @@ class PostFiatTaskManager:
     ## WALLET UX POPULATION 
     def ux__1_get_user_pft_balance(self):
         """Returns the balance of PFT for the user."""
-        client = xrpl.clients.JsonRpcClient(self.network_url)
         account_lines = xrpl.models.requests.AccountLines(
             account=self.user_wallet.classic_address,
+            peer=self.pft_issuer,  # Only get trust lines with PFT issuer
             ledger_index="validated"
         )
-        response = client.request(account_lines)
+        response = run_coroutine(self.client.request(account_lines))
         lines = response.result.get('lines', [])
         for line in lines:
             if line['currency'] == 'PFT':
@@ -2093,42 +2268,45 @@ class PostFiatTaskManager:
             if google_doc_link:
                 account_info['Google Doc'] = google_doc_link
 
-            def extract_latest_message(df, direction, node):
+            def extract_latest_messages(df, node):
                 """
-                Extract the latest message of a given type for a specific node.
+                Extract the latest message in each direction for a specific node, keyed by direction.
+                Memo transactions are appended in ledger order, so a single reverse scan finds both.
                 """
-                is_outgoing = direction == 'OUTGOING'
-                field = 'destination' if is_outgoing else 'account'
-                latest_message = df[
-                    (df['direction'] == direction) &
-                    (df[field] == node)
-                ].tail(1)
-                
-                if not latest_message.empty:
-                    return latest_message.iloc[0].to_dict()
-                else:
-                    return {}
+                latest_positions = {}
+                for position, direction, counterparty_address in zip(
+                    range(len(df) - 1, -1, -1),
+                    df['direction'].to_numpy()[::-1],
+                    df['counterparty_address'].to_numpy()[::-1]
+                ):
+                    if counterparty_address == node and direction not in latest_positions:
+                        latest_positions[direction] = position
+                        if len(latest_positions) == 2:
+                            break
+
+                # Only read the fields format_dict shows, with the datetimes formatted in one call
+                latest_messages = df.iloc[list(latest_positions.values())][['hash', 'task_id', 'full_output', 'datetime']]
+                latest_messages = latest_messages.assign(datetime=latest_messages['datetime'].dt.strftime('%Y-%m-%d %H:%M:%S'))
+                return dict(zip(latest_positions, latest_messages.to_dict('records')))
 
             def format_dict(data):
                 if data:
                     standard_format = self.get_explorer_transaction_url(data.get('hash', ''))
-                    full_output = data.get('memo_data', {}).get('full_output', 'N/A')
-                    task_id = data.get('memo_data', {}).get('task_id', 'N/A')
+                    full_output = data.get('full_output', 'N/A')
+                    task_id = data.get('task_id', 'N/A')
                     formatted_string = (
                         f"Task ID: {task_id}\n"
                         f"Full Output: {full_output}\n"
                         f"Hash: {standard_format}\n"
-                        f"Datetime: {pd.Timestamp(data['datetime']).strftime('%Y-%m-%d %H:%M:%S') if 'datetime' in data else 'N/A'}\n"
+                        f"Datetime: {data.get('datetime', 'N/A')}\n"
                     )
                     return formatted_string
                 
-            # Sorting account info by datetime
             if not self.memo_transactions.empty and len(self.memo_transactions) > 0 and 'datetime' in self.memo_transactions.columns:
-                sorted_account_info = self.memo_transactions.sort_values('datetime', ascending=True).copy()
-
                 # Extracting most recent messages
-                most_recent_outgoing_message = extract_latest_message(sorted_account_info, 'OUTGOING', self.default_node)
-                most_recent_incoming_message = extract_latest_message(sorted_account_info, 'INCOMING', self.default_node)
+                latest_messages = extract_latest_messages(self.memo_transactions, self.default_node)
+                most_recent_outgoing_message = latest_messages.get('OUTGOING', {})
+                most_recent_incoming_message = latest_messages.get('INCOMING', {})
                 
                 # Formatting messages
                 incoming_message = format_dict(most_recent_incoming_message)
@@ -2154,10 +2332,11 @@ class PostFiatTaskManager:
         return response
 
     def get_all_pomodoros(self):
-        task_id_only = self.memo_transactions[self.memo_transactions['memo_data'].apply(lambda x: 'task_id' in str(x))].copy()
-        pomodoros_only = task_id_only[task_id_only['memo_data'].apply(lambda x: '==' in x['task_id'])].copy()
-        pomodoros_only['parent_task_id']=pomodoros_only['memo_data'].apply(lambda x: x['task_id'].replace('==','__'))
-        return pomodoros_only
+        task_ids = self.memo_transactions['task_id']
+        is_pomodoro = task_ids.str.contains('==', regex=False)
+        return self.memo_transactions[is_pomodoro].assign(
+            parent_task_id=task_ids[is_pomodoro].str.replace('==', '__', regex=False)
+        )
     
     def verify_password(self, password):
         """Verifies password for current user"""
@@ -2189,13 +2368,12 @@ class PostFiatTaskManager:
     def get_current_trust_limit(self):
         """Gets the current trust line limit for PFT token"""
         try:
-            client = xrpl.clients.JsonRpcClient(self.network_url)
             request = xrpl.models.requests.AccountLines(
                 account=self.user_wallet.address,
                 peer=self.pft_issuer
             )
             
-            response = client.request(request)
+            response = run_coroutine(self.client.request(request))
             if not response.is_successful():
                 logger.error(f"Failed to get account lines: {response}")
                 return "0"
@@ -2215,13 +2393,12 @@ class PostFiatTaskManager:
     def has_trust_line(self):
         """ Checks if the user has a trust line to the PFT token"""
         try:
-            client = xrpl.clients.JsonRpcClient(self.network_url)
             request = xrpl.models.requests.AccountLines(
                 account=self.user_wallet.address,
                 peer=self.pft_issuer  # Only get trust lines with PFT issuer
             )
             
-            response = client.request(request)
+            response = run_coroutine(self.client.request(request))
             if not response.is_successful():
                 logger.error(f"Failed to get account lines: {response}")
                 return False
@@ -2260,7 +2437,6 @@ class PostFiatTaskManager:
         Returns:
             Transaction response
         """
-        client = xrpl.clients.JsonRpcClient(self.network_url)
         trust_set_tx = xrpl.models.transactions.TrustSet(
             account=self.user_wallet.address,
             limit_amount=xrpl.models.amounts.issued_currency_amount.IssuedCurrencyAmount(
@@ -2271,7 +2447,7 @@ class PostFiatTaskManager:
         )
         logger.debug(f"Creating trust line from {self.user_wallet.address} to issuer...")
         try:
-            response = xrpl.transaction.submit_and_wait(trust_set_tx, client, self.user_wallet)
+            response = run_coroutine(xrpl.asyncio.transaction.submit_and_wait(trust_set_tx, self.client, self.user_wallet))
         except xrpl.transaction.XRPLReliableSubmissionException as e:
             response = f"Submit failed: {e}"
             logger.error(f"Trust line creation failed: {response}")
@@ -2325,7 +2501,7 @@ def calculate_memo_size(memo_format: str, memo_type: str, memo_data: str) -> dic
     }
 
 def to_hex(string):
-    return binascii.hexlify(string.encode()).decode()
+    return string.encode().hex()
 
 def construct_handshake_memo(user, ecdh_public_key) -> str:
     return construct_memo(memo_format=user, memo_type=SystemMemoType.HANDSHAKE.value, memo_data=ecdh_public_key)
@@ -2361,13 +2537,13 @@ def construct_memo(memo_format, memo_type, memo_data, validate_size=False):
     )
 
 def get_xrp_balance(network_url, address):
-    client = xrpl.clients.JsonRpcClient(network_url)
+    client = xrpl.asyncio.clients.AsyncJsonRpcClient(network_url)
     account_info = xrpl.models.requests.account_info.AccountInfo(
         account=address,
         ledger_index="validated"
     )
     try:
-        response = client.request(account_info)
+        response = run_coroutine(client.request(account_info))
         if response.is_successful():
             return response.result['account_data']['Balance']
         else:
@@ -2382,7 +2558,7 @@ def get_xrp_balance(network_url, address):
         return None
 
 def send_xrp(network_url, wallet: xrpl.wallet.Wallet, amount, destination, memo="", destination_tag=None):
-    client = xrpl.clients.JsonRpcClient(network_url)
+    client = xrpl.asyncio.clients.AsyncJsonRpcClient(network_url)
 
     logger.debug(f"Sending {amount} XRP to {destination} with memo {memo}")
 
@@ -2416,7 +2592,7 @@ def send_xrp(network_url, wallet: xrpl.wallet.Wallet, amount, destination, memo=
     payment = xrpl.models.transactions.Payment(**payment_args)
 
     try:    
-        response = xrpl.transaction.submit_and_wait(payment, client, wallet)    
+        response = run_coroutine(xrpl.asyncio.transaction.submit_and_wait(payment, client, wallet))    
     except xrpl.transaction.XRPLReliableSubmissionException as e:
         logger.error(f"Transaction submission failed: {e}")
         raise
@@ -2428,13 +2604,19 @@ def send_xrp(network_url, wallet: xrpl.wallet.Wallet, amount, destination, memo=
 
 def is_valid_id(memo_dict: dict) -> bool:
     """ This function checks if a memo dictionary contains a valid ID pattern (used for both tasks and messages)"""
-    memo_string = str(memo_dict)
-
-    # Check for task ID pattern
-    id_pattern = re.compile(r'(\d{4}-\d{2}-\d{2}_\d{2}:\d{2}(?:__[A-Z0-9]{4})?)')
-    has_valid_pattern = bool(re.search(id_pattern, memo_string))
-
-    return has_valid_pattern
+    # IDs cannot span fields, so searching the values one by one finds the same IDs as searching str(memo_dict)
+    # without building its repr. The ID normally sits in task_id, which is short, so try it before full_output
+    task_id = memo_dict.get('task_id')
+    if task_id is not None and TASK_ID_PATTERN.search(str(task_id)):
+        return True
+    return any(TASK_ID_PATTERN.search(str(value)) for key, value in memo_dict.items() if key != 'task_id')
+
+# (pattern, task type name) pairs flattened in TASK_PATTERNS priority order
+_TASK_PATTERN_LOOKUP = tuple(
+    (pattern, task_type.name)
+    for task_type, patterns in TASK_PATTERNS.items()
+    for pattern in patterns
+)
 
 def classify_task_string(string: str) -> str:
     """ 
@@ -2442,12 +2624,43 @@ def classify_task_string(string: str) -> str:
     Returns the string name of the task type
     """ 
 
-    for task_type, patterns in TASK_PATTERNS.items():
-        if any(pattern in string for pattern in patterns):
-            return task_type.name
+    for pattern, task_type_name in _TASK_PATTERN_LOOKUP:
+        if pattern in string:
+            return task_type_name
 
     return 'UNKNOWN'
 
+def classify_task_strings(strings: pd.Series) -> pd.Series:
+    """
+    Vectorized classify_task_string over a Series of task strings.
+    Returns a TASK_TYPE_DTYPE categorical Series; as in the scalar version, the first matching pattern wins
+    """
+    conditions = [strings.str.contains(pattern, regex=False, na=False).to_numpy() for pattern, _ in _TASK_PATTERN_LOOKUP]
+    codes = np.select(
+        conditions,
+        [TASK_TYPE_DTYPE.categories.get_loc(task_type_name) for _, task_type_name in _TASK_PATTERN_LOOKUP],
+        default=TASK_TYPE_DTYPE.categories.get_loc('UNKNOWN')
+    )
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=TASK_TYPE_DTYPE), index=strings.index)
+
+def serialize_csv_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Returns a copy of df with nested dict columns converted to JSON strings for CSV caching"""
+    nested_columns = {
+        col: df[col].map(lambda x: json.dumps(x) if isinstance(x, (dict, list)) else x)
+        for col in CSV_JSON_COLUMNS if col in df.columns
+    }
+    return df.assign(**nested_columns)
+
+def deserialize_csv_value(value):
+    """Parses a dict column value read from a CSV cache.
+    Values are JSON, but caches written by older versions hold Python reprs."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError:
+        return ast.literal_eval(value)
+
 def is_pft_transaction(tx) -> bool:
     deliver_max = tx.get('DeliverMax', {})
     return isinstance(deliver_max, dict) and deliver_max.get('currency') == 'PFT'
@@ -2484,7 +2697,7 @@ def decompress_string(compressed_string):
             compressed_string += '=' * (4 - missing_padding)
         
         # Validate the string contains only valid Base64 characters
-        if not all(c in string.ascii_letters + string.digits + '+/=' for c in compressed_string):
+        if not BASE64_CHARS.issuperset(compressed_string):
             raise ValueError("Invalid Base64 characters in compressed string")
 
         # Decode the Base64 string to bytes
@@ -2505,8 +2718,8 @@ def get_google_doc_text(share_link):
     # Construct the Google Docs API URL
     url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
 
-    # Send a GET request to the API URL
-    response = requests.get(url)
+    # Send a GET request to the API URL over the shared session
+    response = _DOC_SESSION.get(url, timeout=10)
 
     # Check if the request was successful
     if response.status_code == 200:
@@ -2518,16 +2731,13 @@ def get_google_doc_text(share_link):
     
 def retrieve_xrp_address_from_google_doc(google_doc_text):
     """ Retreives the XRP address from the google doc """
-    # Split the text into lines
-    lines = google_doc_text.split('\n')      
-
-    # Regular expression for XRP address
-    xrp_address_pattern = r'r[1-9A-HJ-NP-Za-km-z]{25,34}'
+    # Split off only the first 5 lines, since the rest of the doc is never searched
+    lines = google_doc_text.split('\n', 5)[:5]
 
     wallet_at_front_of_doc = None
     # look through the first 5 lines for an XRP address
-    for line in lines[:5]:
-        match = re.search(xrp_address_pattern, line)
+    for line in lines:
+        match = XRP_ADDRESS_PATTERN.search(line)
         if match:
             wallet_at_front_of_doc = match.group()
             break
@@ -2593,6 +2803,16 @@ class GoogleDocIsNotSharedException(Exception):
         self.google_url = google_url
         super().__init__(f"Google Doc is not shared: {google_url}")
 
+class TransactionExpiredException(xrpl.asyncio.transaction.XRPLReliableSubmissionException):
+    """ This exception is raised when a submitted transaction passes its LastLedgerSequence without being validated """
+    def __init__(self, latest_ledger, last_ledger_sequence, prelim_result):
+        self.latest_ledger = latest_ledger
+        self.last_ledger_sequence = last_ledger_sequence
+        super().__init__(
+            f"The latest validated ledger sequence {latest_ledger} is greater than LastLedgerSequence "
+            f"{last_ledger_sequence} in the transaction. Prelim result: {prelim_result}"
+        )
+
 class HandshakeRequiredError(Exception):
     """ This exception is raised when a handshake is required """
     def __init__(self, destination):
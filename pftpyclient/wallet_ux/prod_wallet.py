@@ -22,7 +22,6 @@ from xrpl.asyncio.clients import AsyncWebsocketClient
 from loguru import logger
 from cryptography.fernet import InvalidToken
 import pandas as pd
-import nest_asyncio
 
 # PftPyclient imports
 from pftpyclient.utilities.wallet_state import (
@@ -46,6 +45,7 @@ from pftpyclient.configuration.configuration import ConfigurationManager, get_ne
 import pftpyclient.configuration.constants as constants
 from pftpyclient.user_login.migrate_credentials import check_and_show_migration_dialog
 from pftpyclient.utilities.updater import check_and_show_update_dialog
+from pftpyclient.utilities.event_loop import run_coroutine
 from pftpyclient.wallet_ux.dialogs import *
 from pftpyclient.wallet_ux.dialogs import CustomDialog
 from pftpyclient.version import VERSION
@@ -70,9 +70,6 @@ elif os.name == 'posix':
     except webbrowser.Error:
         pass
 
-# Apply the nest_asyncio patch
-nest_asyncio.apply()
-
 UpdateGridEvent, EVT_UPDATE_GRID = wx.lib.newevent.NewEvent()
 
 class WalletUIState(Enum):
@@ -3079,15 +3076,8 @@ class WalletApp(wx.Frame):
 
             logger.debug(f"Attempting to connect to WebSocket endpoint: {endpoint}")
 
-            # Create event loop if needed
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Run connection test
-            success = loop.run_until_complete(self._test_ws_connection(endpoint))
+            # Run connection test on the shared event loop
+            success = run_coroutine(self._test_ws_connection(endpoint))
 
             message = f"{'Successful' if success else 'Failed'} connection to {endpoint}"
             logger.debug(message)
@@ -15,7 +15,6 @@ install_requires = [
     'wxPython',
     'requests',
     'toml',
-    'nest_asyncio',
     'browser_history',
     'sec-cik-mapper',
     'loguru',